@@ -0,0 +1,335 @@
+import asyncio
+import json
+import logging
+import math
+import numbers
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlsplit
+
+from sites import DROP_POLL_SECONDS, list_sites
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Encoded responses kept per (route, query, data version); least recently
+# used evicted
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_TIMEOUT = 15
+
+# Header lines read per request; each line is capped by the stream's 64 KiB
+# limit. The API is GET-only, so request bodies are refused, not read.
+MAX_HEADERS = 100
+
+MAX_SERIES_POINTS = 20_000
+
+log = logging.getLogger(__name__)
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+class NotFound(Exception):
+    pass
+
+
+class BadRequest(Exception):
+    pass
+
+
+def _engine():
+    """The engine module. Imported on first use (the server warms it up in
+    the background) so the server starts without loading pandas."""
+    import engine
+    return engine
+
+
+def _jsonable(value):
+    """Plain JSON value for the scalars pandas and NumPy hand back"""
+    if value is None or isinstance(value, (str, bool)):
+        return value
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        return None if math.isnan(value) else float(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _values(array):
+    return [None if v != v else v for v in array.tolist()]
+
+
+def _site(params):
+    site = params.get("site")
+    if site is None:
+        sites = list_sites()
+        if len(sites) != 1:
+            raise ValueError("site is required")
+        return sites[0]
+    if site not in list_sites():
+        raise NotFound(f"Unknown site: {site}")
+    return site
+
+
+def _window(params):
+    return params.get("start"), params.get("end")
+
+
+def _version(site):
+    # Snapshot.key: the data version plus the FX table, as results carry
+    # converted savings
+    return _engine().get_snapshot(site).key
+
+
+# Route handlers: params -> (site, data version, JSON-able result). Results
+# with a site are cached until that site's data changes. The version is read
+# before computing, so a result is never stamped newer than its data.
+
+def _sites(params):
+    return None, None, {"sites": list_sites()}
+
+
+def _kpis(params):
+    site = _site(params)
+    version = _version(site)
+    result = _engine().kpis(site, *_window(params))
+    return site, version, {
+        "site": site, **{k: _jsonable(v) for k, v in result.items()}}
+
+
+def _summary(params):
+    site = _site(params)
+    version = _version(site)
+    table = _engine().summary(site, *_window(params))
+    return site, version, {
+        "site": site,
+        "columns": {col: {stat: _jsonable(v) for stat, v in table[col].items()}
+                    for col in table.columns}}
+
+
+def _series(params):
+    from currency import CURRENCY_SYMBOLS
+
+    engine = _engine()
+    site = _site(params)
+    columns = params.get("columns")
+    points = int(params.get("points", engine.SERIES_MAX_POINTS))
+    if not 2 <= points <= MAX_SERIES_POINTS:
+        raise ValueError(f"points must be between 2 and {MAX_SERIES_POINTS}")
+    currency = params.get("currency", engine.BASE_CURRENCY)
+    if currency not in CURRENCY_SYMBOLS:
+        raise ValueError(f"Unknown currency: {currency}; expected one of "
+                         f"{', '.join(CURRENCY_SYMBOLS)}")
+    version = _version(site)
+    data, granularity = engine.series(
+        site, None if columns is None else columns.split(","),
+        *_window(params), max_points=points, currency=currency)
+    return site, version, {
+        "site": site,
+        "granularity": granularity,
+        "index": data.index.strftime("%Y-%m-%dT%H:%M:%S").tolist(),
+        "data": {col: _values(data[col].to_numpy(dtype="float64"))
+                 for col in data.columns}}
+
+
+def _fleet(params):
+    from fleet import fleet_kpis
+
+    start, end = _window(params)
+    # Sites already loaded are aggregated from memory, the rest from disk
+    per_site, fleet = fleet_kpis(start=start, end=end,
+                                 snapshots=_engine().loaded_snapshots())
+    return None, None, {
+        "sites": [{"site": site, **{k: _jsonable(v) for k, v in row.items()}}
+                  for site, row in per_site.iterrows()],
+        "fleet": {k: _jsonable(v) for k, v in fleet.items()}}
+
+
+ROUTES = {
+    "/sites": _sites,
+    "/kpis": _kpis,
+    "/summary": _summary,
+    "/series": _series,
+    "/fleet": _fleet,
+}
+
+
+class QueryAPI:
+    """JSON API over the engine.
+
+    Computation runs on a worker thread so the event loop keeps serving;
+    encoded responses are cached per route, query and site data version, so
+    a repeat query is answered from memory without touching the engine.
+    """
+
+    def __init__(self, max_entries=RESPONSE_CACHE_MAX_ENTRIES):
+        self._cache = OrderedDict()
+        self.max_entries = max_entries
+
+    def _cached(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        site, version, body = entry
+        # Only stores that are already loaded are checked; loading one is
+        # left to the worker thread
+        store = _engine().loaded_store(site)
+        if store is None or store.snapshot.key != version:
+            return None
+        self._cache.move_to_end(key)
+        return body
+
+    async def handle(self, method, target):
+        """(status, body) for a request"""
+        if method != "GET":
+            return 405, _encode({"error": "Only GET is supported"})
+        url = urlsplit(target)
+        route = ROUTES.get(url.path)
+        if route is None:
+            return 404, _encode({"error": f"Unknown path: {url.path}"})
+        params = dict(parse_qsl(url.query))
+        key = (url.path, tuple(sorted(params.items())))
+        body = self._cached(key)
+        if body is not None:
+            return 200, body
+        try:
+            loop = asyncio.get_running_loop()
+            site, version, result = await loop.run_in_executor(None, route,
+                                                               params)
+        except NotFound as e:
+            return 404, _encode({"error": str(e)})
+        except ValueError as e:
+            return 400, _encode({"error": str(e)})
+        body = _encode(result)
+        if site is not None:
+            self._cache[key] = (site, version, body)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return 200, body
+
+    async def serve_connection(self, reader, writer):
+        """Answer requests on one connection until the client closes it,
+        asks to, or sits idle past KEEPALIVE_TIMEOUT"""
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader),
+                                                     KEEPALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                except BadRequest as e:
+                    writer.write(_response(400, _encode({"error": str(e)}),
+                                           False))
+                    break
+                if request is None:
+                    break
+                method, target, version, headers = request
+                connection = headers.get("connection", "")
+                keep_alive = (connection != "close" if version == "HTTP/1.1"
+                              else connection == "keep-alive")
+                try:
+                    status, body = await self.handle(method, target)
+                except Exception as e:
+                    log.exception("Error answering %s %s", method, target)
+                    status, body = 500, _encode({"error": repr(e)})
+                writer.write(_response(status, body, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _read_request(reader):
+    """(method, target, HTTP version, headers) of the next request on a
+    connection, or None once the client stops sending. Raises BadRequest for
+    a request head this server won't read, or one with a body."""
+    try:
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        headers = {}
+        for _ in range(MAX_HEADERS + 1):
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+        else:
+            raise BadRequest("Too many headers")
+    except (ValueError, asyncio.LimitOverrunError):
+        # readline() reports a line over the stream limit as ValueError
+        raise BadRequest("Request line or header too long") from None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise BadRequest("Malformed request line") from None
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise BadRequest("Malformed Content-Length") from None
+    if length or "transfer-encoding" in headers:
+        raise BadRequest("Request bodies are not accepted")
+    return method, target, version, headers
+
+
+def _encode(result):
+    return json.dumps(result, separators=(",", ":"), allow_nan=False).encode()
+
+
+def _response(status, body, keep_alive):
+    head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+async def _poll_stores(interval):
+    """Pick up dropped-in telemetry for every loaded site, off the loop.
+
+    A store whose poll fails is logged and tried again next time; the other
+    sites keep ingesting.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        for store in _engine().loaded_stores():
+            try:
+                await loop.run_in_executor(None, store.poll, interval)
+            except Exception:
+                log.exception("Polling %s failed", store.source)
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    api = QueryAPI()
+    server = await asyncio.start_server(api.serve_connection, host, port)
+    warm_up = asyncio.get_running_loop().run_in_executor(None, _engine)
+    poller = asyncio.create_task(_poll_stores(DROP_POLL_SECONDS))
+    print(f"Serving on http://{host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        poller.cancel()
+        await asyncio.gather(warm_up, return_exceptions=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Serve solar KPIs, summaries and series as JSON")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
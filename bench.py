@@ -0,0 +1,233 @@
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from rollups import build_rollups
+from solar_data import (DATE_COLUMN, DEFAULT_CHUNK_SIZE, MEASUREMENT_COLUMNS,
+                        MEASUREMENT_DTYPE, derive_metrics, load_solar_data,
+                        select_window, write_store)
+from summary_stats import build_bucket_stats, window_summary
+
+# Synthetic series: one reading per BENCH_FREQ from BENCH_START, so 1e8 rows
+# span about 190 years (inside the range pandas timestamps can hold)
+BENCH_START = "2000-01-01"
+BENCH_FREQ = "1min"
+BENCH_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+BENCH_REPEATS = 3
+
+# Sizes from this many rows up are timed once; a repeat would take minutes
+SINGLE_RUN_ROWS = 10 ** 7
+
+# The window the time-period stages select: the last 30 days of data
+BENCH_WINDOW = pd.Timedelta(days=30)
+CHART_POINT_BUDGET = 2000
+
+
+def synthetic_chunk(offset, n, seed=0):
+    """n synthetic records in the export schema, starting offset rows in.
+
+    Irradiance follows a daily sine cycle cut by cloud cover; temperatures,
+    energy, CO2 and money follow from it, with noise. Each chunk is seeded
+    from its offset, so the data doesn't depend on the chunk size.
+    """
+    rng = np.random.default_rng([seed, offset])
+    first = pd.Timestamp(BENCH_START) + offset * pd.Timedelta(BENCH_FREQ)
+    dates = pd.date_range(first, periods=n, freq=BENCH_FREQ)
+    day_fraction = (dates.hour.to_numpy() * 60 + dates.minute.to_numpy()) / 1440
+    sun = np.clip(np.sin((day_fraction - 0.25) * 2 * np.pi), 0, None)
+    cloud = rng.uniform(0, 100, n)
+    irradiance = 1000 * sun * (1 - 0.75 * (cloud / 100) ** 3.4) + rng.normal(0, 10, n)
+    irradiance = np.clip(irradiance, 0, None)
+    ambient = 15 + 10 * sun + rng.normal(0, 2, n)
+    energy = irradiance * 5 * 0.18 / 1000 / 60 + np.abs(rng.normal(0, 0.001, n))
+    columns = {
+        "Solar_Irradiance_W/m2": irradiance,
+        "Panel_Temperature_C": ambient + irradiance * 0.03,
+        "Ambient_Temperature_C": ambient,
+        "Cloud_Cover_%": cloud,
+        "Energy_Generated_kWh": energy,
+        "CO2_Saved_kg": energy * 0.4,
+        "Money_Saved_INR": energy * 8.0,
+    }
+    chunk = {DATE_COLUMN: dates.values}
+    for col in MEASUREMENT_COLUMNS:
+        chunk[col] = columns[col].astype(MEASUREMENT_DTYPE)
+    return chunk
+
+
+def generate_store(path, n_rows, chunk_size=DEFAULT_CHUNK_SIZE, seed=0):
+    """Write n_rows synthetic records to an Arrow store, a chunk at a time,
+    so memory use is bounded by chunk_size"""
+    write_store((synthetic_chunk(offset, min(chunk_size, n_rows - offset), seed)
+                 for offset in range(0, n_rows, chunk_size)), path)
+    return path
+
+
+def _render(window):
+    from downsample import downsample
+    import plotly.express as px
+
+    data = downsample(window, 'energy_kwh', CHART_POINT_BUDGET)
+    fig = px.line(data, x=data.index, y='energy_kwh')
+    return fig.to_json()
+
+
+def bench_stages(path):
+    """(stage, fn) pairs for one data file, in pipeline order. Each stage
+    reuses the previous stages' results, computed once up front."""
+    state = {}
+
+    def load():
+        return load_solar_data(path)
+
+    def derive():
+        return derive_metrics(state['frame'])
+
+    def window():
+        metrics = state['metrics']
+        return select_window(metrics, metrics.index[-1] - BENCH_WINDOW)
+
+    def rollups():
+        return build_rollups(state['metrics'])
+
+    def bucket_stats():
+        return build_bucket_stats(state['metrics'])
+
+    def summary():
+        metrics = state['metrics']
+        return window_summary(state['bucket_stats'], metrics,
+                              metrics.index[-1] - BENCH_WINDOW)
+
+    def describe():
+        return state['window'][['energy_kwh', 'co2_saved_kg',
+                                'cost_saved']].describe()
+
+    def render():
+        return _render(state['window'])
+
+    # Plotly's import and first figure cost a one-off ~100 ms; keep it out
+    # of single-run timings
+    _render(pd.DataFrame({'energy_kwh': [0.0, 1.0]},
+                         index=pd.date_range(BENCH_START, periods=2)))
+
+    stages = [('load', load), ('derive', derive), ('window', window),
+              ('rollups', rollups), ('bucket_stats', bucket_stats),
+              ('summary', summary), ('describe', describe), ('render', render)]
+    keep = {'load': 'frame', 'derive': 'metrics', 'window': 'window',
+            'bucket_stats': 'bucket_stats'}
+
+    def prepare(name):
+        if name in keep:
+            state[keep[name]] = dict(stages)[name]()
+
+    return stages, prepare
+
+
+def measure(fn, repeats):
+    """Best and mean wall time over repeats runs, then the peak memory
+    (MB) traced during one more run.
+
+    Tracing sees Python and NumPy allocations but not Arrow's buffers; see
+    max_rss_mb in run() for those.
+    """
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(times), sum(times) / len(times), peak / 2 ** 20
+
+
+def _max_rss_mb():
+    """High-water resident memory of this process so far (Linux reports KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(sizes=BENCH_SIZES, stages=None, repeats=BENCH_REPEATS, data_dir=None):
+    """Benchmark every stage at every size; returns a list of result dicts.
+    Sizes run smallest first, so each max_rss_mb is mostly down to the
+    size it is reported with."""
+    data_dir = data_dir or tempfile.mkdtemp(prefix="solar-bench-")
+    os.makedirs(data_dir, exist_ok=True)
+    results = []
+    for n_rows in sorted(sizes):
+        path = os.path.join(data_dir, f"bench_{n_rows}.arrow")
+        if not os.path.exists(path):
+            generate_store(path, n_rows)
+        pipeline, prepare = bench_stages(path)
+        runs = 1 if n_rows >= SINGLE_RUN_ROWS else repeats
+        for name, fn in pipeline:
+            if stages is None or name in stages:
+                best, mean, peak_mb = measure(fn, runs)
+                results.append({'rows': n_rows, 'stage': name,
+                                'best_s': best, 'mean_s': mean,
+                                'repeats': runs, 'peak_mb': peak_mb,
+                                'max_rss_mb': _max_rss_mb()})
+                print(f"{n_rows:>11,} {name:<13} {best * 1000:10.2f} ms "
+                      f"{peak_mb:9.1f} MB", file=sys.stderr)
+            prepare(name)
+    return results
+
+
+def environment():
+    """Code version and platform the results were measured on"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+            text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+            check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    import pyarrow
+    return {
+        'commit': commit,
+        'timestamp': pd.Timestamp.now(tz="UTC").isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'pyarrow': pyarrow.__version__,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Time and measure peak memory of the load, window, "
+                    "aggregate and render stages on synthetic data")
+    parser.add_argument("--sizes", default=",".join(f"{n:.0e}" for n in BENCH_SIZES),
+                        help="comma-separated row counts, e.g. 1e3,1e6,1e8")
+    parser.add_argument("--stage", action="append", dest="stages",
+                        help="only run this stage (repeatable)")
+    parser.add_argument("--repeats", type=int, default=BENCH_REPEATS)
+    parser.add_argument("--data-dir",
+                        help="where to keep generated data (reused across runs)")
+    parser.add_argument("--out", help="write JSON results here (default: stdout)")
+    args = parser.parse_args()
+
+    sizes = [int(float(size)) for size in args.sizes.split(",")]
+    report = {'environment': environment(),
+              'results': run(sizes, args.stages, args.repeats, args.data_dir)}
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=1)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+        print()
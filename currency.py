@@ -0,0 +1,69 @@
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Dated FX table: a Date column plus INR per unit of each other currency,
+# one row per date the rates changed
+FX_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         "data", "fx_rates.csv")
+FX_DATE_COLUMN = "Date"
+
+# Currency the telemetry records money in, and the one cost_saved is kept in
+SOURCE_CURRENCY = "INR"
+BASE_CURRENCY = "USD"
+
+CURRENCY_SYMBOLS = {"USD": "$", "EUR": "€", "GBP": "£", "INR": "₹"}
+
+
+@lru_cache(maxsize=4)
+def _read_fx_rates(path, mtime_ns):
+    fx = pd.read_csv(path, parse_dates=[FX_DATE_COLUMN])
+    return fx.sort_values(FX_DATE_COLUMN, kind="stable", ignore_index=True)
+
+
+def fx_version(path=FX_SOURCE):
+    """Identity of the FX table on disk (its mtime). Anything holding
+    converted amounts keys its cache on this too."""
+    return os.stat(path).st_mtime_ns
+
+
+def load_fx_rates(path=FX_SOURCE):
+    """The FX table sorted by date; re-read only when the file changes"""
+    return _read_fx_rates(path, fx_version(path))
+
+
+def rates_at(index, currency, fx=None):
+    """INR per unit of currency in effect at every timestamp of a sorted
+    DatetimeIndex.
+
+    Each timestamp takes the latest rate dated at or before it (an as-of
+    merge: one pass over both sorted inputs); timestamps before the first
+    dated rate take the earliest one.
+    """
+    if currency == SOURCE_CURRENCY:
+        return np.ones(len(index))
+    fx = load_fx_rates() if fx is None else fx
+    table = pd.DataFrame({
+        FX_DATE_COLUMN: fx[FX_DATE_COLUMN].astype(index.dtype),
+        'rate': fx[currency].to_numpy(dtype=np.float64),
+    })
+    merged = pd.merge_asof(pd.DataFrame({FX_DATE_COLUMN: index}), table,
+                           on=FX_DATE_COLUMN, direction="backward")
+    rates = merged['rate'].to_numpy()
+    return np.where(np.isnan(rates), table['rate'].iloc[0], rates)
+
+
+def convert(amounts, from_currency, to_currency, fx=None):
+    """A date-indexed series of amounts converted at each row's dated rate"""
+    if from_currency == to_currency:
+        return amounts
+    index = amounts.index
+    factor = rates_at(index, from_currency, fx) / rates_at(index, to_currency, fx)
+    return pd.Series(amounts.to_numpy(dtype=np.float64) * factor,
+                     index=index, name=amounts.name)
+
+
+def format_money(amount, currency, precision=2):
+    return f"{CURRENCY_SYMBOLS.get(currency, currency + ' ')}{amount:,.{precision}f}"
@@ -0,0 +1,118 @@
+import numpy as np
+
+MODES = ("lttb", "minmax")
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: positions of the points to keep.
+
+    Keeps the first and last point and, for each of n_out - 2 equal buckets
+    in between, the point forming the largest triangle with the previously
+    kept point and the average of the next bucket. Bucket averages and the
+    per-bucket areas are computed with NumPy; only the walk over buckets is
+    a Python loop, since each choice depends on the previous one.
+
+    NaN readings are skipped: averages are over each bucket's real values
+    (a bucket with none looks further ahead), the triangle's first corner
+    is the last real point kept, and a bucket only yields a NaN point when
+    it has nothing else.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    x = x - x[0]
+    y = np.asarray(y, dtype=np.float64)
+    valid = ~np.isnan(y)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.add.reduceat(valid[:n - 1].astype(np.int64), edges[:-1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avg_x = np.add.reduceat(np.where(valid, x, 0.0)[:n - 1], edges[:-1]) / counts
+        avg_y = np.add.reduceat(np.where(valid, y, 0.0)[:n - 1], edges[:-1]) / counts
+    # Look-ahead point for bucket i is the average of bucket i + 1 (or of
+    # the next bucket with real values); the last bucket looks ahead to the
+    # final point
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+    ahead = np.where(np.isnan(next_y), len(next_y) - 1, np.arange(len(next_y)))
+    ahead = np.minimum.accumulate(ahead[::-1])[::-1]
+    next_x, next_y = next_x[ahead], next_y[ahead]
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nx, ny = next_x[i], next_y[i]
+        if np.isnan(ny):
+            # Nothing real ahead: favour the point furthest from the anchor
+            nx, ny = x[-1], y[a]
+        area = np.abs((x[a] - nx) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (ny - y[a]))
+        area = np.where(np.isnan(area), -1.0, area)
+        out[i + 1] = lo + int(np.argmax(area))
+        if valid[out[i + 1]]:
+            a = out[i + 1]
+    return out
+
+
+def minmax_indices(y, n_out):
+    """Min/max envelope: positions of each bucket's minimum and maximum.
+
+    Splits the series into n_out // 2 equal buckets and keeps both extremes
+    of each, so spikes survive. Fully vectorised via a padded 2-D view.
+    """
+    n = len(y)
+    n_buckets = n_out // 2
+    if n_out >= n or n_buckets < 1:
+        return np.arange(n)
+
+    y = np.asarray(y, dtype=np.float64)
+    size = -(-n // n_buckets)
+    n_buckets = -(-n // size)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(n_buckets, size)
+
+    offsets = np.arange(n_buckets) * size
+    lows = offsets + np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1)
+    highs = offsets + np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1)
+    keep = np.unique(np.concatenate([lows, highs, [0, n - 1]]))
+    return keep[keep < n]
+
+
+def downsample_indices(df, column, n_out, mode="lttb"):
+    """Positions of the rows downsample() keeps for column"""
+    if len(df) <= n_out:
+        return np.arange(len(df))
+    if mode == "lttb":
+        return lttb_indices(df.index.asi8, df[column].to_numpy(), n_out)
+    if mode == "minmax":
+        return minmax_indices(df[column].to_numpy(), n_out)
+    raise ValueError(f"Unknown downsampling mode: {mode}")
+
+
+def downsample(df, column, n_out, mode="lttb"):
+    """Reduce df to about n_out rows, chosen to preserve the shape of column.
+
+    df must be indexed by a sorted DatetimeIndex. Returns a positional slice
+    of df in original order.
+    """
+    if len(df) <= n_out:
+        return df
+    return df.iloc[downsample_indices(df, column, n_out, mode)]
+
+
+def downsample_many(df, columns, n_out, mode="lttb"):
+    """Reduce df to about n_out rows shared by several columns.
+
+    Each column gets an equal share of the budget and the kept positions are
+    merged, so every series can be drawn against one common x array.
+    """
+    if len(df) <= n_out:
+        return df
+    share = max(n_out // len(columns), 3)
+    keep = [downsample_indices(df, col, share, mode) for col in columns]
+    return df.iloc[np.unique(np.concatenate(keep))]
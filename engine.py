@@ -0,0 +1,144 @@
+import threading
+
+import pandas as pd
+
+from currency import BASE_CURRENCY, convert
+from downsample import downsample_many
+from fleet import partial_kpis, window_partial
+from rollups import (GRANULARITIES, chart_frame, choose_granularity,
+                     window_rollup)
+from sites import list_sites
+from store import SolarStore
+from summary_stats import window_summary
+from whatif import graph as whatif
+
+# Columns a series query may ask for
+SERIES_COLUMNS = ['energy_kwh', 'co2_saved_kg', 'solar_irradiance', 'cost_saved']
+
+# Series queries: minimum points before switching to a coarser rollup, and
+# default max points returned
+SERIES_MIN_POINTS = 100
+SERIES_MAX_POINTS = 2000
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(site):
+    """The process-wide store for a site, created on first use"""
+    store = _stores.get(site)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(site)
+            if store is None:
+                store = _stores[site] = SolarStore.for_site(site)
+    return store
+
+
+def loaded_store(site):
+    """The site's store if it has been loaded, else None; never loads"""
+    return _stores.get(site)
+
+
+def loaded_stores():
+    return list(_stores.values())
+
+
+def loaded_snapshots():
+    """{site: current snapshot} of every loaded store; never loads"""
+    return {site: store.snapshot for site, store in list(_stores.items())}
+
+
+def get_snapshot(site):
+    """Current data for a site, after picking up any dropped-in telemetry.
+    Shared and read-only."""
+    store = get_store(site)
+    store.poll()
+    return store.snapshot
+
+
+def clear():
+    """Forget every loaded store and computed series"""
+    with _stores_lock:
+        _stores.clear()
+    whatif.clear()
+
+
+def _timestamp(value):
+    return None if value is None else pd.Timestamp(value)
+
+
+def _end_after(index, end):
+    """Exclusive end selecting the same rows of index as the inclusive end"""
+    if end is None:
+        return None
+    hi = index.searchsorted(end, side="right")
+    return index[hi] if hi < len(index) else None
+
+
+def chart_source(site, snapshot, start, end, min_points,
+                 currency=BASE_CURRENCY):
+    """Data to chart for [start, end]: the raw rows, or the coarsest rollup
+    that still gives min_points, with cost_saved in currency. Returns (data,
+    granularity or None).
+
+    Rollup buckets cut by the window only count the rows inside it, and the
+    first one is dated from start rather than from before the window.
+    """
+    metrics = snapshot.metrics
+    plot_data = metrics.loc[start:end]
+    granularity = None
+    if len(plot_data) > min_points:
+        granularity = choose_granularity(snapshot.rollups, start, end,
+                                         min_points)
+    if granularity is not None:
+        data = chart_frame(window_rollup(
+            snapshot.rollups[granularity], metrics, GRANULARITIES[granularity],
+            start, _end_after(metrics.index, end)))
+        if start is not None:
+            data.index = data.index.where(data.index >= start, start)
+        if currency != BASE_CURRENCY:
+            # Buckets are converted at the rate of their start date
+            data = data.assign(cost_saved=convert(
+                data['cost_saved'], BASE_CURRENCY, currency))
+        return data, granularity
+    if currency != BASE_CURRENCY:
+        cost = whatif.get('cost_in_currency', (site, snapshot.key),
+                          snapshot, currency=currency)
+        plot_data = plot_data.assign(cost_saved=cost.loc[start:end])
+    return plot_data, None
+
+
+def kpis(site, start=None, end=None):
+    """Totals for a site over [start, end): energy, CO2 and savings, mean
+    irradiance, row count and last reading"""
+    snapshot = get_snapshot(site)
+    return partial_kpis(window_partial(snapshot.metrics, _timestamp(start),
+                                       _timestamp(end)))
+
+
+def summary(site, start=None, end=None):
+    """describe()-style summary of a site's metrics over [start, end)"""
+    snapshot = get_snapshot(site)
+    return window_summary(snapshot.bucket_stats, snapshot.metrics,
+                          _timestamp(start), _timestamp(end))
+
+
+def series(site, columns=None, start=None, end=None,
+           max_points=SERIES_MAX_POINTS, currency=BASE_CURRENCY):
+    """Chartable series for [start, end]: raw rows or a rollup, downsampled
+    to about max_points. Returns (frame, granularity or None)."""
+    columns = SERIES_COLUMNS if columns is None else list(columns)
+    unknown = set(columns) - set(SERIES_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+    snapshot = get_snapshot(site)
+    data, granularity = chart_source(site, snapshot, _timestamp(start),
+                                     _timestamp(end), SERIES_MIN_POINTS,
+                                     currency)
+    data = downsample_many(data[columns], columns, max_points)
+    return data, granularity
+
+
+def sites():
+    return list_sites()
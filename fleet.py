@@ -0,0 +1,189 @@
+import multiprocessing
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from currency import fx_version
+from sites import list_sites, partition_version, site_source
+from solar_data import derive_metrics, select_window
+from store import load_partition
+
+# Columns aggregated per site; all are summed, irradiance is reported as the
+# mean (sum / rows)
+KPI_COLUMNS = ['energy_kwh', 'co2_saved_kg', 'cost_saved', 'solar_irradiance']
+
+# Fleets smaller than this are aggregated in-process; process start-up and
+# IPC would cost more than they save
+PARALLEL_MIN_SITES = 16
+
+# Fleet results kept per (site versions, window)
+FLEET_CACHE_SIZE = 128
+
+
+def window_partial(metrics, start=None, end=None):
+    """Mergeable partial aggregate of one site's metrics over [start, end).
+
+    Row count, per-column float64 sums and the last timestamp; partials of
+    several sites (or several slices of one site) merge by addition.
+    """
+    window = select_window(metrics, start, end)
+    partial = {'rows': len(window),
+               'last': window.index[-1] if len(window) else None}
+    for col in KPI_COLUMNS:
+        partial[col] = float(np.sum(window[col].to_numpy(), dtype=np.float64))
+    return partial
+
+
+def merge_partials(partials):
+    """Combine partial aggregates into one"""
+    merged = {'rows': sum(p['rows'] for p in partials),
+              'last': max((p['last'] for p in partials if p['last'] is not None),
+                          default=None)}
+    for col in KPI_COLUMNS:
+        merged[col] = sum(p[col] for p in partials)
+    return merged
+
+
+def partial_kpis(partial):
+    """KPIs of a (merged) partial aggregate"""
+    rows = partial['rows']
+    return {
+        'energy_kwh': partial['energy_kwh'],
+        'co2_saved_kg': partial['co2_saved_kg'],
+        'cost_saved': partial['cost_saved'],
+        'solar_irradiance': partial['solar_irradiance'] / rows if rows else np.nan,
+        'rows': rows,
+        'last_reading': partial['last'],
+    }
+
+
+def kpi_table(sites, partials):
+    """Per-site KPIs ranked by energy, plus fleet totals.
+
+    Returns (per_site frame indexed by site with a 'rank' column, fleet
+    Series).
+    """
+    per_site = pd.DataFrame([partial_kpis(p) for p in partials],
+                            index=pd.Index(sites, name='site'))
+    per_site = per_site.sort_values('energy_kwh', ascending=False, kind="stable")
+    per_site.insert(0, 'rank', np.arange(1, len(per_site) + 1))
+    fleet = pd.Series(partial_kpis(merge_partials(partials)), name='fleet')
+    return per_site, fleet
+
+
+def _load_metrics(source):
+    frame, _, _ = load_partition(source)
+    return derive_metrics(frame)
+
+
+# Worker side: each pool process is only ever sent its own share of the
+# sites (see _worker_for), so it keeps every partition it is given, as
+# source -> (version, metrics), and repeated queries only slice and sum
+_worker_metrics = {}
+
+
+def _share_partials(tasks):
+    partials = []
+    for source, version, start, end in tasks:
+        cached = _worker_metrics.get(source)
+        if cached is None or cached[0] != version:
+            # Release the stale copy before loading the new one
+            _worker_metrics.pop(source, None)
+            cached = _worker_metrics[source] = (version, _load_metrics(source))
+        partials.append(window_partial(cached[1], start, end))
+    return partials
+
+
+_workers = None
+_workers_lock = threading.Lock()
+
+
+def _get_workers():
+    """One single-process pool per CPU, shared by every fleet query
+    (spawned, not forked, so it is safe to start from a threaded server)"""
+    global _workers
+    with _workers_lock:
+        if _workers is None:
+            context = multiprocessing.get_context("spawn")
+            _workers = [ProcessPoolExecutor(max_workers=1, mp_context=context)
+                        for _ in range(os.cpu_count() or 1)]
+        return _workers
+
+
+def _worker_for(site, n_workers):
+    """Worker that always handles site. crc32 rather than hash(), which is
+    salted per process; adding a site leaves the others where they are."""
+    return zlib.crc32(site.encode()) % n_workers
+
+
+def _disk_partials(site_versions, start, end):
+    """Window partials of sites read from their partitions, in order"""
+    tasks = [(site_source(site), version, start, end)
+             for site, version in site_versions]
+    if len(tasks) < PARALLEL_MIN_SITES:
+        # Nothing is kept in-process: callers that hold sites in memory
+        # pass their snapshots instead
+        return [window_partial(_load_metrics(source), start, end)
+                for source, _, start, end in tasks]
+    workers = _get_workers()
+    shares = [[] for _ in workers]
+    for i, (site, _) in enumerate(site_versions):
+        shares[_worker_for(site, len(workers))].append(i)
+    futures = [(share, worker.submit(_share_partials, [tasks[i] for i in share]))
+               for worker, share in zip(workers, shares) if share]
+    partials = [None] * len(tasks)
+    for share, future in futures:
+        for i, partial in zip(share, future.result()):
+            partials[i] = partial
+    return partials
+
+
+# (site versions, start, end) -> (per_site, fleet), least recently used first
+_results = OrderedDict()
+_results_lock = threading.Lock()
+
+
+def fleet_kpis(sites=None, start=None, end=None, snapshots=None):
+    """Per-site and fleet KPIs over [start, end).
+
+    snapshots maps site -> a loaded store snapshot (anything with key and
+    metrics); those sites are aggregated from memory. The rest are read
+    from their partitions on disk, in parallel across a process pool when
+    there are many, and the partial aggregates merged. Results are cached
+    per window and per version of every site, so repeat queries are a
+    lookup. Returns the same (per_site, fleet) pair as kpi_table(); both are
+    shared - don't modify.
+    """
+    snapshots = {} if snapshots is None else snapshots
+    sites = list_sites() if sites is None else list(sites)
+    # Savings depend on the FX table too, so it is part of every version
+    fx = fx_version()
+    site_versions = tuple(
+        (site, snapshots[site].key if site in snapshots
+         else (partition_version(site_source(site)), fx))
+        for site in sites)
+    start = None if start is None else pd.Timestamp(start)
+    end = None if end is None else pd.Timestamp(end)
+    key = (site_versions, start, end)
+    with _results_lock:
+        if key in _results:
+            _results.move_to_end(key)
+            return _results[key]
+
+    partials = [window_partial(snapshots[site].metrics, start, end)
+                if site in snapshots else None for site in sites]
+    on_disk = [i for i, partial in enumerate(partials) if partial is None]
+    loaded = _disk_partials([site_versions[i] for i in on_disk], start, end)
+    for i, partial in zip(on_disk, loaded):
+        partials[i] = partial
+    result = kpi_table(sites, partials)
+    with _results_lock:
+        _results[key] = result
+        while len(_results) > FLEET_CACHE_SIZE:
+            _results.popitem(last=False)
+    return result
@@ -0,0 +1,65 @@
+import json
+import subprocess
+import sys
+
+# Import-time budget (ms) per module, and heavy packages it must not load.
+# Tools that only locate or queue data, and the API server until its first
+# query, stay off pandas; only the dashboard may load Streamlit or Plotly.
+HEAVY_DATA = ("numpy", "pandas", "pyarrow")
+HEAVY_UI = ("streamlit", "plotly")
+
+IMPORT_BUDGETS = {
+    "sites": (10, HEAVY_DATA + HEAVY_UI),
+    "timing": (10, HEAVY_DATA + HEAVY_UI),
+    "api": (50, HEAVY_DATA + HEAVY_UI),
+    "solar_data": (400, HEAVY_UI),
+    "store": (400, HEAVY_UI),
+    "fleet": (400, HEAVY_UI),
+    "engine": (450, HEAVY_UI),
+    "index": (1000, ()),
+}
+
+# Each module is imported this many times in a fresh interpreter; the
+# fastest run counts, which filters out disk-cache and scheduling noise
+REPEATS = 3
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000,
+                  "loaded": sorted(m for m in sys.modules if "." not in m)}}))
+"""
+
+
+def measure(module, repeats=REPEATS):
+    """(fastest import time in ms, top-level modules loaded) for module"""
+    runs = []
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", _PROBE.format(module=module)],
+                             capture_output=True, text=True, check=True)
+        runs.append(json.loads(out.stdout.splitlines()[-1]))
+    fastest = min(runs, key=lambda run: run["ms"])
+    return fastest["ms"], set(fastest["loaded"])
+
+
+def check(budgets=IMPORT_BUDGETS, repeats=REPEATS):
+    """Measure every module; returns a list of (module, ms, budget ms,
+    forbidden packages it loaded, within budget)"""
+    results = []
+    for module, (budget, forbidden) in budgets.items():
+        ms, loaded = measure(module, repeats)
+        bad = sorted(loaded.intersection(forbidden))
+        results.append((module, ms, budget, bad, ms <= budget and not bad))
+    return results
+
+
+if __name__ == "__main__":
+    failed = False
+    for module, ms, budget, bad, ok in check():
+        note = f"  loads {', '.join(bad)}" if bad else ""
+        print(f"{'ok  ' if ok else 'FAIL'} {module:<12} {ms:7.1f} ms "
+              f"(budget {budget} ms){note}")
+        failed |= not ok
+    sys.exit(1 if failed else 0)
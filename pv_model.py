@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+# Standard test conditions the panel ratings refer to
+STC_IRRADIANCE = 1000.0     # W/m2
+STC_TEMPERATURE = 25.0      # °C
+
+TEMPERATURE_COEFFICIENT = -0.004  # efficiency change per °C above STC
+SYSTEM_LOSSES = 0.14              # wiring, inverter, soiling, mismatch
+
+# Kasten-Czeplak cloud attenuation: 1 - A * (cloud fraction) ** B
+CLOUD_ATTENUATION = 0.75
+CLOUD_EXPONENT = 3.4
+
+
+def row_hours(index):
+    """Hours each row covers: the gap to the next row, capped at the nominal
+    interval (the median gap) so a row before an outage isn't credited with
+    the whole outage. The last row gets the nominal interval."""
+    if len(index) < 2:
+        return np.full(len(index), 24.0)
+    gaps = np.diff(index.to_numpy()) / np.timedelta64(1, "h")
+    nominal = np.median(gaps)
+    return np.append(np.minimum(gaps, nominal), nominal)
+
+
+def expected_energy(df, capacity_kw, panel_efficiency):
+    """Expected generation (kWh) per row for a system of capacity_kw.
+
+    Panel area follows from the rated capacity and efficiency; output scales
+    with irradiance, loses efficiency as the panel heats above 25 °C, is
+    attenuated by cloud cover and reduced by fixed system losses. One
+    vectorised pass over the whole series.
+    """
+    irradiance = df['Solar_Irradiance_W/m2'].to_numpy(dtype=np.float64)
+    panel_temp = df['Panel_Temperature_C'].to_numpy(dtype=np.float64)
+    cloud = df['Cloud_Cover_%'].to_numpy(dtype=np.float64) / 100.0
+
+    # Rated capacity is the output at STC, which fixes the panel area (m2)
+    area = capacity_kw / (panel_efficiency * STC_IRRADIANCE / 1000.0)
+    efficiency = panel_efficiency * (
+        1 + TEMPERATURE_COEFFICIENT * (panel_temp - STC_TEMPERATURE))
+    cloud_factor = 1 - CLOUD_ATTENUATION * np.clip(cloud, 0, 1) ** CLOUD_EXPONENT
+    power_kw = irradiance / 1000.0 * area * np.clip(efficiency, 0, None)
+    energy = power_kw * cloud_factor * (1 - SYSTEM_LOSSES) * row_hours(df.index)
+    return pd.Series(energy, index=df.index, name='expected_kwh')
+
+
+def performance_ratio(actual, expected):
+    """Actual over expected generation; below 1 means underperforming"""
+    total = np.sum(expected.to_numpy(), dtype=np.float64)
+    if total == 0:
+        return np.nan
+    return np.sum(actual.to_numpy(), dtype=np.float64) / total
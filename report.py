@@ -0,0 +1,175 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+
+from fleet import partial_kpis, window_partial
+from rollups import GRANULARITIES, window_rollup
+from sites import SITES_DIR, list_sites, site_source
+from store import SolarStore
+from summary_stats import window_summary
+
+REPORT_KINDS = ("metrics", "summary", "rollups")
+REPORT_FORMATS = ("csv", "parquet", "json")
+
+
+def parse_window(text):
+    """'START:END' (either side may be empty) -> (start, end) timestamps,
+    None for an open side. Bounds are ISO 8601 dates or date-times; the
+    colons of a time of day are told apart from the separator by trying
+    each split in turn."""
+    def bound(part):
+        return pd.Timestamp(datetime.fromisoformat(part)) if part else None
+
+    for i, char in enumerate(text):
+        if char == ":":
+            try:
+                return bound(text[:i]), bound(text[i + 1:])
+            except ValueError:
+                continue
+    raise ValueError(f"Window must be START:END, got {text!r}")
+
+
+def window_label(start, end):
+    """File-name friendly label of a window: both bounds as full ISO
+    timestamps without colons, so windows that differ only in time of day
+    get different labels"""
+    if start is None and end is None:
+        return "all"
+    return "_".join("" if ts is None else ts.isoformat().replace(":", "")
+                    for ts in (start, end))
+
+
+def write_frame(df, path, fmt):
+    """Write df to path + '.' + fmt; the index is written as a column"""
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.set_axis(["_".join(col) for col in df.columns], axis=1)
+    df = df.reset_index()
+    path = f"{path}.{fmt}"
+    if fmt == "csv":
+        df.to_csv(path, index=False)
+    elif fmt == "parquet":
+        df.to_parquet(path, index=False)
+    elif fmt == "json":
+        df.to_json(path, orient="records", date_format="iso", indent=1)
+    else:
+        raise ValueError(f"Unknown format: {fmt}")
+    return path
+
+
+def site_report(site, windows, kinds=REPORT_KINDS, granularities=None,
+                fmt="csv", out_dir="reports"):
+    """Every requested output for one site, for every window.
+
+    The site is loaded once; its rollups and bucket statistics are built in
+    that same pass, and each window is then answered from them plus the raw
+    rows at its edges. Summary and rollup files go to out_dir/<site>/.
+    Returns (metric rows, paths written).
+    """
+    snapshot = SolarStore(site_source(site)).snapshot
+    metrics = snapshot.metrics
+    granularities = list(GRANULARITIES) if granularities is None else granularities
+    site_dir = os.path.join(out_dir, site)
+    os.makedirs(site_dir, exist_ok=True)
+
+    rows, written = [], []
+    for start, end in windows:
+        label = window_label(start, end)
+        if "metrics" in kinds:
+            kpis = partial_kpis(window_partial(metrics, start, end))
+            rows.append({'site': site, 'window_start': start,
+                         'window_end': end, **kpis})
+        if "summary" in kinds:
+            summary = window_summary(snapshot.bucket_stats, metrics, start, end)
+            written.append(write_frame(summary.rename_axis("stat"),
+                                       os.path.join(site_dir, f"summary_{label}"),
+                                       fmt))
+        if "rollups" in kinds:
+            for name in granularities:
+                rollup = window_rollup(snapshot.rollups[name], metrics,
+                                       GRANULARITIES[name], start, end)
+                written.append(write_frame(
+                    rollup, os.path.join(site_dir, f"{name}_{label}"), fmt))
+    return rows, written
+
+
+def _site_report(args):
+    return site_report(*args)
+
+
+def resolve_sites(sites=None):
+    """The sites to report on (default: every site), checked against
+    list_sites(). Raises ValueError for an unknown site or when there are
+    none."""
+    known = list_sites()
+    sites = known if sites is None else list(sites)
+    unknown = sorted(set(sites) - set(known))
+    if unknown:
+        raise ValueError(f"Unknown sites: {', '.join(unknown)}; expected any "
+                         f"of: {', '.join(known) or '(none)'}")
+    if not sites:
+        raise ValueError(f"No sites to report on: no partitions in {SITES_DIR}")
+    return sites
+
+
+def run_report(sites=None, windows=((None, None),), kinds=REPORT_KINDS,
+               granularities=None, fmt="csv", out_dir="reports", workers=1):
+    """Reports for several sites, workers of them at a time in separate
+    processes. Metrics for every site and window are collected into one
+    out_dir/metrics file. Returns the paths written."""
+    sites = resolve_sites(sites)
+    tasks = [(site, list(windows), kinds, granularities, fmt, out_dir)
+             for site in sites]
+    os.makedirs(out_dir, exist_ok=True)
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(
+                max_workers=min(workers, len(tasks)),
+                mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = list(pool.map(_site_report, tasks))
+    else:
+        results = [_site_report(task) for task in tasks]
+
+    written = [path for _, paths in results for path in paths]
+    if "metrics" in kinds:
+        metrics = pd.DataFrame([row for rows, _ in results for row in rows])
+        written.insert(0, write_frame(metrics.set_index('site'),
+                                      os.path.join(out_dir, "metrics"), fmt))
+    return written
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Export metrics, summary statistics and rollups for "
+                    "sites and windows")
+    parser.add_argument("--site", action="append", dest="sites",
+                        help="site to report on (repeatable; default: all)")
+    parser.add_argument("--window", action="append", dest="windows",
+                        type=parse_window, metavar="START:END",
+                        help="window to report on, e.g. 2024-01-01:2024-02-01 "
+                             "or 2024-01-01T06:00:2024-01-01T18:00 "
+                             "(repeatable; either side may be empty; "
+                             "default: all data)")
+    parser.add_argument("--kind", action="append", dest="kinds",
+                        choices=REPORT_KINDS,
+                        help="output to produce (repeatable; default: all)")
+    parser.add_argument("--granularity", action="append", dest="granularities",
+                        choices=list(GRANULARITIES),
+                        help="rollup granularity (repeatable; default: all)")
+    parser.add_argument("--format", default="csv", choices=REPORT_FORMATS)
+    parser.add_argument("--out", default="reports", help="output directory")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="sites processed in parallel")
+    args = parser.parse_args()
+    try:
+        sites = resolve_sites(args.sites)
+    except ValueError as e:
+        parser.error(str(e))
+
+    written = run_report(sites, args.windows or [(None, None)],
+                         tuple(args.kinds or REPORT_KINDS), args.granularities,
+                         args.format, args.out, args.workers)
+    print(f"Wrote {len(written)} files to {args.out}")
@@ -0,0 +1,161 @@
+import pandas as pd
+
+from solar_data import select_window
+
+# Bucket sizes, finest to coarsest (pandas resample rules)
+GRANULARITIES = {
+    "daily": "D",
+    "weekly": "W",
+    "monthly": "MS",
+    "yearly": "YS",
+}
+
+ROLLUP_COLUMNS = ['energy_kwh', 'co2_saved_kg', 'cost_saved', 'solar_irradiance']
+ROLLUP_STATS = ['sum', 'mean', 'min', 'max', 'count']
+
+# Which statistic a chart plots for each metric: totals for the additive
+# metrics, average for irradiance
+CHART_STATS = {
+    'energy_kwh': 'sum',
+    'co2_saved_kg': 'sum',
+    'cost_saved': 'sum',
+    'solar_irradiance': 'mean',
+}
+
+
+def build_rollups(df, columns=ROLLUP_COLUMNS):
+    """Materialise sum/mean/min/max/count per bucket at every granularity.
+
+    Returns {granularity: frame} where each frame is indexed by bucket start
+    and has (metric, stat) columns. Empty buckets are dropped.
+    """
+    return {name: _rollup(df, rule, columns)
+            for name, rule in GRANULARITIES.items()}
+
+
+def _rollup(df, rule, columns):
+    resampler = df[columns].resample(rule, label="left", closed="left")
+    agg = resampler.agg(ROLLUP_STATS)
+    return agg[agg[(columns[0], 'count')] > 0]
+
+
+def _bucket_bounds(index, start, end):
+    """Positions of the buckets overlapping [start, end], including the
+    bucket that start falls in"""
+    lo = 0 if start is None else max(index.searchsorted(start, side="right") - 1, 0)
+    hi = len(index) if end is None else index.searchsorted(end, side="right")
+    return lo, max(hi, lo)
+
+
+def bucket_count(rollup, start=None, end=None):
+    """Number of buckets in a rollup overlapping start..end"""
+    lo, hi = _bucket_bounds(rollup.index, start, end)
+    return hi - lo
+
+
+def choose_granularity(rollups, start=None, end=None, min_points=100):
+    """Pick the coarsest granularity that still gives min_points buckets.
+
+    Returns None when no rollup is fine enough, meaning the raw rows should
+    be plotted.
+    """
+    for name in reversed(list(GRANULARITIES)):
+        if bucket_count(rollups[name], start, end) >= min_points:
+            return name
+    return None
+
+
+def chart_frame(rollup, start=None, end=None, stats=CHART_STATS):
+    """Flatten a rollup into one column per metric for plotting"""
+    lo, hi = _bucket_bounds(rollup.index, start, end)
+    window = rollup.iloc[lo:hi]
+    return pd.DataFrame({
+        metric: window[(metric, stat)] for metric, stat in stats.items()
+    })
+
+
+def window_rollup(rollup, df, rule, start=None, end=None,
+                  columns=ROLLUP_COLUMNS):
+    """Rollup of only the rows of df in [start, end).
+
+    Buckets wholly inside the window are taken from rollup (built from df
+    at rule); the partial buckets at either edge are rebuilt from df's rows
+    there, so the result is exact while reading at most two buckets of raw
+    rows.
+    """
+    index = rollup.index
+    if not len(df) or not len(index):
+        return _rollup(select_window(df, start, end), rule, columns)
+    # Bucket i ends at or before index[i + 1] (empty buckets are dropped);
+    # the last one ends with the data
+    open_start = start is None or pd.Timestamp(start) <= df.index[0]
+    open_end = end is None or pd.Timestamp(end) > df.index[-1]
+    lo = 0 if open_start else index.searchsorted(pd.Timestamp(start), side="left")
+    hi = len(index) if open_end else index.searchsorted(pd.Timestamp(end),
+                                                         side="right") - 1
+    if hi <= lo:
+        return _rollup(select_window(df, start, end), rule, columns)
+
+    parts = [rollup.iloc[lo:hi]]
+    if lo > 0 and not open_start:
+        parts.insert(0, _rollup(select_window(df, start, index[lo]), rule,
+                                columns))
+    if hi < len(index):
+        parts.append(_rollup(select_window(df, index[hi], end), rule, columns))
+    return pd.concat([p for p in parts if len(p)])
+
+
+def _bucket_start(ts, rule):
+    """Start of the rule-sized bucket containing ts, as build_rollups() bins it"""
+    probe = pd.Series([0], index=pd.DatetimeIndex([ts]))
+    return probe.resample(rule, label="left", closed="left").sum().index[0]
+
+
+def update_rollups(rollups, df, since, columns=ROLLUP_COLUMNS):
+    """Refresh rollups after rows at or after since were added to df.
+
+    Only the buckets from the one containing since onwards are rebuilt:
+    the finest granularity's from df's rows, the coarser ones from the
+    finest's buckets (days nest in weeks, months and years), so an append
+    never re-reads more than a bucket of raw rows. Earlier buckets are
+    reused as-is. Returns a new dict.
+    """
+    updated = {}
+    finest = None
+    for name, rule in GRANULARITIES.items():
+        cutoff = _bucket_start(since, rule)
+        old = rollups[name]
+        if finest is None:
+            tail = _rollup(select_window(df, cutoff), rule, columns)
+        else:
+            buckets = finest.iloc[finest.index.searchsorted(cutoff):]
+            grouped = buckets.resample(rule, label="left", closed="left")
+            tail = _combined(grouped, columns)
+        updated[name] = pd.concat([old[old.index < cutoff], tail])
+        if finest is None:
+            finest = updated[name]
+    return updated
+
+
+def _combined(grouped, columns):
+    """Rollup rows from grouped rollup rows: sums and counts add, min/max
+    of the extremes, and means are recomputed as sum / count. Empty groups
+    are dropped."""
+    sums, mins, maxs = grouped.sum(), grouped.min(), grouped.max()
+    combined = {}
+    for col in columns:
+        total, count = sums[(col, 'sum')], sums[(col, 'count')]
+        combined[(col, 'sum')] = total
+        combined[(col, 'mean')] = (total / count).astype(total.dtype)
+        combined[(col, 'min')] = mins[(col, 'min')]
+        combined[(col, 'max')] = maxs[(col, 'max')]
+        combined[(col, 'count')] = count
+    combined = pd.DataFrame(combined)
+    return combined[combined[(columns[0], 'count')] > 0]
+
+
+def merge_rollups(rollups, columns=ROLLUP_COLUMNS):
+    """Combine the same-granularity rollups of several series (e.g. sites)
+    into one: sums and counts add, min/max of the extremes, and means are
+    recomputed as sum / count."""
+    return _combined(pd.concat(rollups).groupby(level=0), columns)
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from pv_model import expected_energy
+from solar_data import select_window
+
+
+def sweep(frame, metrics, capacities, rates, panel_efficiency,
+          start=None, end=None):
+    """Evaluate every (capacity, rate) combination over [start, end).
+
+    The PV model is linear in capacity, so it runs once for a 1 kW system
+    and every scenario follows by broadcasting the capacity and rate axes
+    against that total - no Python loop per scenario. Returns a long table
+    with one row per scenario.
+    """
+    capacities = np.asarray(capacities, dtype=np.float64)
+    rates = np.asarray(rates, dtype=np.float64)
+    frame = select_window(frame, start, end)
+    actual_kwh = np.sum(select_window(metrics, start, end)['energy_kwh'].to_numpy(),
+                        dtype=np.float64)
+    unit_kwh = expected_energy(frame, 1.0, panel_efficiency).sum()
+
+    expected_kwh = capacities[:, None] * unit_kwh              # (C, 1)
+    expected_savings = expected_kwh * rates[None, :]           # (C, R)
+    actual_savings = np.broadcast_to(actual_kwh * rates[None, :],
+                                     expected_savings.shape)   # (C, R)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.broadcast_to(actual_kwh / expected_kwh, expected_savings.shape)
+
+    grid_c, grid_r = np.meshgrid(capacities, rates, indexing="ij")
+    return pd.DataFrame({
+        'capacity_kw': grid_c.ravel(),
+        'rate': grid_r.ravel(),
+        'expected_kwh': np.broadcast_to(expected_kwh, grid_c.shape).ravel(),
+        'expected_savings': expected_savings.ravel(),
+        'actual_savings': actual_savings.ravel(),
+        'performance_ratio': ratio.ravel(),
+    })
+
+
+def savings_grid(results, value='expected_savings'):
+    """Pivot a sweep into a capacity x rate matrix for a heatmap"""
+    return results.pivot(index='capacity_kw', columns='rate', values=value)
@@ -0,0 +1,100 @@
+import os
+import shutil
+import time
+
+# Site layout on disk. Standard library only, so tools that just locate or
+# queue data (and every module's import of these names) stay fast.
+
+# Data files live next to this module; each site's history is its own
+# partition under sites/, an uncompressed Arrow IPC file that is
+# memory-mapped on load
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SITES_DIR = os.path.join(DATA_DIR, "sites")
+DEFAULT_SITE = "main"
+PARTITION_EXT = ".arrow"
+
+# New telemetry files (JSON arrays or CSV) are dropped here, in a folder
+# per site, to be appended. Write them under another name and rename into
+# place so a half-written file is never picked up. Ingested files move to
+# processed/, files that can't be parsed to failed/, and DROP_LOCK keeps two
+# processes from ingesting the same folder at once.
+DROP_DIR = os.path.join(DATA_DIR, "incoming")
+PROCESSED_DIR = "processed"
+FAILED_DIR = "failed"
+DROP_LOCK = ".ingest.lock"
+
+# Held in a partition's segment folder while its segments are folded into
+# the base file
+COMPACT_LOCK = ".compact.lock"
+DROP_POLL_SECONDS = 5
+
+
+def site_source(site):
+    """Path of a site's partition"""
+    return os.path.join(SITES_DIR, site + PARTITION_EXT)
+
+
+def list_sites():
+    """Ids of every site with a partition, sorted"""
+    if not os.path.isdir(SITES_DIR):
+        return []
+    return sorted(os.path.splitext(name)[0] for name in os.listdir(SITES_DIR)
+                  if name.endswith(PARTITION_EXT))
+
+
+DEFAULT_SOURCE = site_source(DEFAULT_SITE)
+
+
+def segment_dir_for(source):
+    """Appended rows for a source live in <source name>.segments/"""
+    return os.path.splitext(source)[0] + ".segments"
+
+
+def segment_paths(segment_dir):
+    if not os.path.isdir(segment_dir):
+        return []
+    names = sorted(n for n in os.listdir(segment_dir) if n.endswith(".parquet"))
+    return [os.path.join(segment_dir, n) for n in names]
+
+
+def partition_version(source, segments=None):
+    """Cheap identity of a partition's on-disk state, without loading it:
+    the base file's mtime and the number of appended segments. Segments are
+    only ever added until a compaction folds them into a new base file, so
+    equal versions mean equal data. Pass segments when the segment paths
+    have already been listed."""
+    if segments is None:
+        segments = segment_paths(segment_dir_for(source))
+    return (os.stat(source).st_mtime_ns, len(segments))
+
+
+def drop_dir_for(site):
+    return os.path.join(DROP_DIR, site)
+
+
+def drop_file(path, site=DEFAULT_SITE):
+    """Hand a telemetry export for a site to the dashboard by copying it
+    into the site's drop folder atomically"""
+    drop_dir = drop_dir_for(site)
+    os.makedirs(drop_dir, exist_ok=True)
+    name = f"{time.time_ns()}-{os.path.basename(path)}"
+    tmp = os.path.join(drop_dir, "." + name + ".tmp")
+    shutil.copyfile(path, tmp)
+    os.replace(tmp, os.path.join(drop_dir, name))
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Queue telemetry exports for ingestion by the dashboard")
+    parser.add_argument("exports", nargs="+", help="JSON or CSV export files")
+    parser.add_argument("--site", default=DEFAULT_SITE)
+    args = parser.parse_args(argv)
+    for path in args.exports:
+        drop_file(path, args.site)
+        print(f"Queued {path} for ingestion at site {args.site}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+import csv
+import json
+import os
+import re
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from currency import BASE_CURRENCY, SOURCE_CURRENCY, convert
+from sites import DEFAULT_SOURCE
+
+# Record schema of the telemetry exports
+DATE_COLUMN = "Date"
+MEASUREMENT_COLUMNS = [
+    "Solar_Irradiance_W/m2",
+    "Panel_Temperature_C",
+    "Ambient_Temperature_C",
+    "Cloud_Cover_%",
+    "Energy_Generated_kWh",
+    "CO2_Saved_kg",
+    "Money_Saved_INR",
+]
+
+# Measurements are held as float32: ample precision for sensor readings at
+# half the memory of float64
+MEASUREMENT_DTYPE = np.float32
+
+# Measurement columns the dashboard uses under a short canonical name
+METRIC_COLUMNS = {
+    "Energy_Generated_kWh": "energy_kwh",
+    "CO2_Saved_kg": "co2_saved_kg",
+}
+
+# Rows per column buffer when streaming large exports
+DEFAULT_CHUNK_SIZE = 100_000
+
+# Longest single record (in characters) the JSON reader will buffer while
+# waiting for the rest of it
+MAX_JSON_RECORD_CHARS = 1 << 20
+
+# What a number or literal cut off at the end of a read buffer looks like
+_PARTIAL_TOKEN = re.compile(r"[\w.+-]{0,32}")
+
+
+def _finalize(df):
+    """Index by date and add the derived columns the dashboard expects"""
+    df = df.set_index(DATE_COLUMN)
+    df = df.astype({col: MEASUREMENT_DTYPE for col in MEASUREMENT_COLUMNS})
+    # Window queries binary-search the index, so it must be sorted
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index(kind="stable")
+    df['solar_irradiance'] = df['Solar_Irradiance_W/m2'] * 0.001
+    return df
+
+
+def derive_metrics(df, cost_saved=None):
+    """Return a new frame with the dashboard's metric columns.
+
+    Metrics stored as-is are renamed rather than duplicated, so each value
+    is held in exactly one column. cost_saved is Money_Saved_INR in
+    BASE_CURRENCY at the FX rate of each reading's date; pass it (row for
+    row with df) when it is already known, to skip the FX lookup; a
+    MEASUREMENT_DTYPE array is used as-is, without a copy.
+    """
+    if cost_saved is None:
+        cost_saved = convert(df['Money_Saved_INR'], SOURCE_CURRENCY,
+                             BASE_CURRENCY)
+    cost_saved = pd.Series(np.asarray(cost_saved, dtype=MEASUREMENT_DTYPE),
+                           index=df.index, copy=False)
+    return df.rename(columns=METRIC_COLUMNS).assign(cost_saved=cost_saved)
+
+
+def select_window(df, start=None, end=None):
+    """Rows with start <= Date < end, found by binary search.
+
+    Relies on the sorted DatetimeIndex _finalize() guarantees, so lookup is
+    O(log n) and the result is a positional slice rather than a masked copy.
+    Either bound may be None for an open-ended window.
+    """
+    index = df.index
+    lo = 0 if start is None else index.searchsorted(pd.Timestamp(start), side="left")
+    hi = len(index) if end is None else index.searchsorted(pd.Timestamp(end), side="left")
+    return df.iloc[lo:max(hi, lo)]
+
+
+def records_to_frame(records):
+    """Build the Date-indexed frame from a list of record dicts"""
+    df = pd.DataFrame(records, columns=[DATE_COLUMN] + MEASUREMENT_COLUMNS)
+    df[DATE_COLUMN] = pd.to_datetime(df[DATE_COLUMN])
+    return _finalize(df)
+
+
+def load_arrow(path):
+    """Load a columnar Arrow IPC store by memory-mapping it.
+
+    write_store() leaves the file uncompressed with a single record batch,
+    so each measurement column of the frame is a view of the mapped file:
+    nothing is copied and pages are only read when touched. The mapped
+    pages are read-only; pandas copies a column before any write to it.
+    """
+    import pyarrow as pa
+
+    with pa.memory_map(path) as source:
+        table = pa.ipc.open_file(source).read_all()
+    return _finalize(table.to_pandas(split_blocks=True))
+
+
+def load_parquet(path):
+    """Load a Parquet file (appended segments are kept in Parquet).
+
+    Unlike load_arrow() this is not zero-copy: each compressed column is
+    decoded into an Arrow buffer once, which then becomes the column's
+    memory, with every column in its own block (no consolidation copy).
+    """
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path)
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    return _finalize(df)
+
+
+def _cut_short(buf, err):
+    """Whether a decode error is the record running past the end of buf,
+    which reading more may fix, rather than malformed JSON"""
+    tail = buf[err.pos:]
+    if err.msg.startswith("Unterminated string"):
+        return True
+    if err.msg.startswith("Invalid \\uXXXX escape"):
+        return len(tail) < 6
+    # Nothing left, or a number or literal (true, null, ...) cut off
+    return _PARTIAL_TOKEN.fullmatch(tail) is not None
+
+
+def iter_json_records(path, buffer_size=1 << 16,
+                      max_record_chars=MAX_JSON_RECORD_CHARS):
+    """Yield records one at a time from a JSON array export.
+
+    The file is read in buffer_size pieces and each object is decoded as soon
+    as it is complete, so the whole array is never held in memory. Malformed
+    input raises ValueError with the path and the character offset in the
+    file; so does a single record longer than max_record_chars, or anything
+    but whitespace after the closing bracket.
+    """
+    decoder = json.JSONDecoder()
+    with open(path) as f:
+        buf = ""
+        pos = 0
+        offset = 0          # characters of the file before buf[0]
+        expect = "["        # "[", then "value" and "," in turn
+        first = True
+        eof = False
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos == len(buf):
+                if eof:
+                    raise ValueError(f"Unexpected end of JSON array in {path}")
+                offset += len(buf)
+                buf, pos = f.read(buffer_size), 0
+                eof = not buf
+                continue
+            char = buf[pos]
+            if expect == "[":
+                if char != "[":
+                    raise ValueError(f"Expected a JSON array in {path}")
+                expect = "value"
+                pos += 1
+                continue
+            if char == "]" and (expect == "," or first):
+                # Only whitespace may follow the array
+                tail, at = buf[pos + 1:], offset + pos + 1
+                while not tail.strip(" \t\r\n"):
+                    at += len(tail)
+                    tail = f.read(buffer_size)
+                    if not tail:
+                        return
+                at += len(tail) - len(tail.lstrip(" \t\r\n"))
+                raise ValueError(f"Unexpected data after the JSON array in "
+                                 f"{path} at char {at}")
+            if expect == ",":
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']' in {path} at char "
+                                     f"{offset + pos}")
+                expect = "value"
+                pos += 1
+                continue
+            try:
+                record, end = decoder.raw_decode(buf, pos)
+                # A number cut off in buf ("-0.", "1e") decodes short, so
+                # if only token characters follow, it may go on in the next read
+                complete = eof or _PARTIAL_TOKEN.fullmatch(buf, end) is None
+            except json.JSONDecodeError as err:
+                if eof or not _cut_short(buf, err):
+                    raise ValueError(f"Malformed JSON record in {path} at char "
+                                     f"{offset + err.pos}: {err.msg}") from None
+                complete = False
+            if not complete:
+                if len(buf) - pos > max_record_chars:
+                    raise ValueError(f"JSON record in {path} at char "
+                                     f"{offset + pos} is longer than "
+                                     f"{max_record_chars} characters")
+                # Record is split across reads - keep its start, pull in more
+                # and retry
+                more = f.read(buffer_size)
+                eof = not more
+                offset += pos
+                buf, pos = buf[pos:] + more, 0
+                continue
+            yield record
+            pos = end
+            expect = ","
+            first = False
+
+
+def iter_csv_records(path):
+    """Yield records one at a time from a CSV export with a header row"""
+    with open(path, newline="") as f:
+        yield from csv.DictReader(f)
+
+
+RECORD_READERS = {
+    ".json": iter_json_records,
+    ".csv": iter_csv_records,
+}
+
+
+def iter_column_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Convert a JSON/CSV export into typed column buffers, chunk by chunk.
+
+    Yields dicts of NumPy arrays (datetime64 for Date, MEASUREMENT_DTYPE for
+    the measurements) holding at most chunk_size rows each.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in RECORD_READERS:
+        raise ValueError(f"Unsupported export format: {path}")
+
+    dates = []
+    values = {col: np.empty(chunk_size, dtype=MEASUREMENT_DTYPE)
+              for col in MEASUREMENT_COLUMNS}
+    n = 0
+    for record in RECORD_READERS[ext](path):
+        dates.append(record[DATE_COLUMN])
+        for col, buf in values.items():
+            buf[n] = record[col]
+        n += 1
+        if n == chunk_size:
+            yield _flush_chunk(dates, values, n)
+            dates = []
+            values = {col: np.empty(chunk_size, dtype=MEASUREMENT_DTYPE)
+                      for col in MEASUREMENT_COLUMNS}
+            n = 0
+    if n:
+        yield _flush_chunk(dates, values, n)
+
+
+def _flush_chunk(dates, values, n):
+    chunk = {DATE_COLUMN: pd.to_datetime(dates).values}
+    for col, buf in values.items():
+        chunk[col] = buf[:n]
+    return chunk
+
+
+def _spool_chunks(chunks, spool_dir):
+    """Append every column chunk to a raw file per column in spool_dir.
+
+    Returns (row count, {column: (path, dtype)}).
+    """
+    files, dtypes, rows = {}, {}, 0
+    try:
+        for chunk in chunks:
+            for col, values in chunk.items():
+                if col not in files:
+                    files[col] = open(os.path.join(spool_dir, f"{len(files)}.bin"),
+                                      "wb")
+                    dtypes[col] = values.dtype
+                values.astype(dtypes[col], copy=False).tofile(files[col])
+            rows += len(chunk[DATE_COLUMN])
+    finally:
+        for f in files.values():
+            f.close()
+    return rows, {col: (f.name, dtypes[col]) for col, f in files.items()}
+
+
+def _empty_columns():
+    columns = {DATE_COLUMN: np.empty(0, dtype="datetime64[us]")}
+    columns.update({col: np.empty(0, dtype=MEASUREMENT_DTYPE)
+                    for col in MEASUREMENT_COLUMNS})
+    return columns
+
+
+def stream_solar_data(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Load a large JSON/CSV export without materialising per-record dicts.
+
+    The column chunks are spooled to temporary files, then read straight
+    into arrays of the final length that become the frame's columns, so
+    peak memory is the frame plus one chunk.
+    """
+    with tempfile.TemporaryDirectory() as spool_dir:
+        rows, spooled = _spool_chunks(iter_column_chunks(path, chunk_size),
+                                      spool_dir)
+        columns = {} if rows else _empty_columns()
+        for col, (file, dtype) in spooled.items():
+            columns[col] = np.empty(rows, dtype=dtype)
+            with open(file, "rb") as f:
+                f.readinto(columns[col])
+    return _finalize(pd.DataFrame(columns, copy=False))
+
+
+LOADERS = {
+    ".json": stream_solar_data,
+    ".csv": stream_solar_data,
+    ".arrow": load_arrow,
+    ".parquet": load_parquet,
+}
+
+
+def load_solar_data(source=DEFAULT_SOURCE):
+    """Load solar data from a JSON, CSV or Parquet file, picked by extension"""
+    ext = os.path.splitext(source)[1].lower()
+    if ext not in LOADERS:
+        raise ValueError(f"Unsupported data source: {source}")
+    return LOADERS[ext](source)
+
+
+def write_store(chunks, path, metadata=None):
+    """Write column chunks (as iter_column_chunks() yields them) to an
+    uncompressed Arrow IPC file holding one record batch, the layout
+    load_arrow() maps without copying.
+
+    The chunks are spooled to a temporary file per column and the batch is
+    written from memory maps of those, so memory use is bounded by one
+    chunk rather than the size of the store. The file is written under a
+    temporary name and renamed into place, with metadata (a dict of bytes or
+    str) added to its schema. Returns the number of rows.
+    """
+    import pyarrow as pa
+
+    with tempfile.TemporaryDirectory() as spool_dir:
+        rows, spooled = _spool_chunks(chunks, spool_dir)
+        columns = {} if rows else _empty_columns()
+        for col, (file, dtype) in spooled.items():
+            columns[col] = np.memmap(file, dtype=dtype, mode="r")
+        table = pa.table(columns).replace_schema_metadata(metadata)
+        tmp = os.path.join(os.path.dirname(path) or ".",
+                           f".{os.path.basename(path)}.{os.getpid()}.tmp")
+        with pa.OSFile(tmp, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        del table, columns
+    os.replace(tmp, path)
+    return rows
+
+
+def convert_export(export_path, store_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """One-shot conversion of a JSON or CSV export into an Arrow store.
+
+    The export is streamed chunk by chunk, so memory use is bounded by
+    chunk_size rather than the size of the export.
+    """
+    return write_store(iter_column_chunks(export_path, chunk_size), store_path)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 3:
+        sys.exit("usage: python solar_data.py <export.json|csv> <store.arrow>")
+    rows = convert_export(sys.argv[1], sys.argv[2])
+    print(f"Wrote {rows} rows to {sys.argv[2]}")
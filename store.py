@@ -0,0 +1,462 @@
+import itertools
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from currency import fx_version
+from rollups import build_rollups, chart_frame, merge_rollups, update_rollups
+from sites import (COMPACT_LOCK, DEFAULT_SOURCE, DROP_LOCK, DROP_POLL_SECONDS,
+                   FAILED_DIR, PARTITION_EXT, PROCESSED_DIR, drop_dir_for,
+                   segment_dir_for, segment_paths, site_source)
+from solar_data import (DATE_COLUMN, MEASUREMENT_COLUMNS, RECORD_READERS,
+                        derive_metrics, load_solar_data, records_to_frame,
+                        stream_solar_data, write_store)
+from summary_stats import build_bucket_stats, update_bucket_stats
+
+log = logging.getLogger(__name__)
+
+# Tells apart segments one process writes within the same nanosecond
+_segment_ids = itertools.count()
+
+# Spare room (as a fraction of the rows held) left at the end of the
+# in-memory columns when they have to grow, so that appends in time order
+# are written in place: an append costs O(rows appended), amortised
+APPEND_HEADROOM = 0.25
+
+# poll() folds a partition's segments into its base file once there are
+# this many, so loading and polling never list and open thousands of files
+COMPACT_SEGMENTS = 64
+
+# Schema metadata of a compacted base file: the segments folded into it,
+# and the mtime of the base file it replaced
+FOLDED_KEY = b"solar.folded_segments"
+COMPACTED_FROM_KEY = b"solar.compacted_from"
+
+
+def _compaction(source):
+    """(mtime of the base it replaced, names of the segments folded in) for
+    a compacted base file; (None, empty set) for any other source"""
+    if not source.endswith(PARTITION_EXT):
+        return None, frozenset()
+    import pyarrow as pa
+
+    with pa.memory_map(source) as f:
+        metadata = pa.ipc.open_file(f).schema.metadata or {}
+    if FOLDED_KEY not in metadata:
+        return None, frozenset()
+    return (int(metadata[COMPACTED_FROM_KEY]),
+            frozenset(json.loads(metadata[FOLDED_KEY])))
+
+
+def load_partition(source):
+    """A partition's rows: the base source plus its appended segments,
+    minus any segment already folded into the base.
+
+    Returns (frame, version, names of every segment listed). Starts over if
+    the partition is compacted while it is being read.
+    """
+    segment_dir = segment_dir_for(source)
+    while True:
+        mtime = os.stat(source).st_mtime_ns
+        _, folded = _compaction(source)
+        try:
+            frame = load_solar_data(source)
+            segments = segment_paths(segment_dir)
+            names = [os.path.basename(path) for path in segments]
+            frames = [load_solar_data(path)
+                      for path, name in zip(segments, names)
+                      if name not in folded]
+        except FileNotFoundError:
+            continue
+        if os.stat(source).st_mtime_ns == mtime:
+            break
+    if frames:
+        frame = _sorted(pd.concat([frame] + frames))
+    return frame, (mtime, len(segments)), set(names)
+
+
+def _sorted(df):
+    if df.index.is_monotonic_increasing:
+        return df
+    return df.sort_index(kind="stable")
+
+
+class _Columns:
+    """A store's rows as column arrays with spare room at the end.
+
+    Rows appended in time order are copied into the spare room, so an
+    append doesn't copy the history. frames() returns views of the rows
+    written so far; later appends only write past them, so frames already
+    handed out never change.
+    """
+
+    def __init__(self, frame, cost_saved, capacity):
+        self.n = len(frame)
+        self.names = list(frame.columns)
+        self.dates = self._room(frame.index.to_numpy(), capacity)
+        self.values = {col: self._room(frame[col].to_numpy(), capacity)
+                       for col in self.names}
+        self.cost_saved = self._room(cost_saved.to_numpy(), capacity)
+
+    def _room(self, values, capacity):
+        buf = np.empty(capacity, dtype=values.dtype)
+        buf[:self.n] = values
+        return buf
+
+    @property
+    def spare(self):
+        return len(self.dates) - self.n
+
+    def write(self, rows, cost_saved):
+        lo, hi = self.n, self.n + len(rows)
+        self.dates[lo:hi] = rows.index.to_numpy()
+        for col in self.names:
+            self.values[col][lo:hi] = rows[col].to_numpy()
+        self.cost_saved[lo:hi] = cost_saved.to_numpy()
+        self.n = hi
+
+    def frames(self):
+        """(frame, cost_saved) of the rows written so far, without copying"""
+        n = self.n
+        index = pd.DatetimeIndex(self.dates[:n], copy=False, name=DATE_COLUMN)
+        frame = pd.DataFrame({col: self.values[col][:n] for col in self.names},
+                             index=index, copy=False)
+        return frame, pd.Series(self.cost_saved[:n], index=index, copy=False)
+
+
+@contextmanager
+def _try_lock(path):
+    """Hold an exclusive lock on the file at path; yields False at once,
+    rather than waiting, when another process holds it. The OS drops the
+    lock if its holder dies."""
+    with open(path, "a") as f:
+        try:
+            if os.name == "nt":
+                import msvcrt
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+        yield True
+
+
+class Snapshot:
+    """One consistent, read-only view of a store's data.
+
+    version is the partition_version() of the partition loaded, so it
+    identifies the data and is stable across process restarts. fx_version
+    is the FX table cost_saved was converted with (currency.fx_version()).
+    """
+
+    __slots__ = ("version", "frame", "metrics", "rollups", "bucket_stats",
+                 "fx_version")
+
+    def __init__(self, version, frame, metrics, rollups, bucket_stats,
+                 fx_version):
+        self.version = version
+        self.frame = frame
+        self.metrics = metrics
+        self.rollups = rollups
+        self.bucket_stats = bucket_stats
+        self.fx_version = fx_version
+
+    @property
+    def key(self):
+        """Identity of everything in the snapshot, money included: what
+        caches of values derived from it are keyed on"""
+        return (self.version, self.fx_version)
+
+
+class SolarStore:
+    """Solar data for one source, plus everything derived from it.
+
+    Appended rows are persisted as Parquet segments next to the source and
+    folded into the in-memory frame, metrics, rollups and bucket statistics
+    incrementally. Several processes may hold a store over the same source:
+    each picks up the segments the others write on its next poll(), and
+    compact() periodically folds the segments into the base file. Readers
+    take store.snapshot, which is replaced atomically on every append, so
+    they never see a half-applied update.
+    """
+
+    def __init__(self, source=DEFAULT_SOURCE, drop_dir=None):
+        self.source = source
+        self.segment_dir = segment_dir_for(source)
+        self.drop_dir = drop_dir
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._last_poll = 0.0
+        self._load()
+
+    def _load(self):
+        """(Re)load the whole partition from disk"""
+        frame, version, self._segments = load_partition(self.source)
+        self._columns = None
+        fx = fx_version()
+        metrics = derive_metrics(frame)
+        self.snapshot = Snapshot(version, frame, metrics,
+                                 build_rollups(metrics),
+                                 build_bucket_stats(metrics), fx)
+
+    @property
+    def version(self):
+        return self.snapshot.version
+
+    @classmethod
+    def for_site(cls, site):
+        """Store over a site's partition and drop folder"""
+        return cls(site_source(site), drop_dir_for(site))
+
+    def rows_after(self, ts):
+        """The current snapshot and its metric rows strictly newer than ts
+        (all rows when ts is None)"""
+        snapshot = self.snapshot
+        metrics = snapshot.metrics
+        if ts is None:
+            return snapshot, metrics
+        lo = metrics.index.searchsorted(pd.Timestamp(ts), side="right")
+        return snapshot, metrics.iloc[lo:]
+
+    def append(self, rows, name=None):
+        """Append a Date-indexed frame of new rows; returns the new version.
+
+        The rows are written as a segment named name, or a name unique to
+        this process and moment, through a temporary file renamed into
+        place: stores in other processes never see it half-written or
+        overwrite it.
+        """
+        if not len(rows):
+            return self.version
+        if name is None:
+            name = f"{time.time_ns()}-{os.getpid()}-{next(_segment_ids)}.parquet"
+        os.makedirs(self.segment_dir, exist_ok=True)
+        tmp = os.path.join(self.segment_dir, f".{name}.{os.getpid()}.tmp")
+        rows[MEASUREMENT_COLUMNS].reset_index().to_parquet(tmp, index=False)
+        os.replace(tmp, os.path.join(self.segment_dir, name))
+        return self.refresh({name: rows})
+
+    def refresh(self, known=None):
+        """Fold in every segment this store hasn't loaded yet, whichever
+        process wrote it; returns the version. known maps segment names to
+        their rows when those are already in memory.
+
+        If another process compacted the partition, nothing is reloaded
+        when this store already held every segment folded into the new base
+        file; any other change to the base file reloads the partition, as
+        does a change to the FX table (cost_saved is re-derived).
+        """
+        with self._lock:
+            if fx_version() != self.snapshot.fx_version:
+                self._load()
+                return self.version
+            while True:
+                mtime = os.stat(self.source).st_mtime_ns
+                if mtime != self.version[0]:
+                    compacted_from, folded = _compaction(self.source)
+                    if (compacted_from != self.version[0]
+                            or not folded <= self._segments):
+                        self._load()
+                        return self.version
+                segments = segment_paths(self.segment_dir)
+                new = [path for path in segments
+                       if os.path.basename(path) not in self._segments]
+                known = known or {}
+                try:
+                    parts = [known.get(os.path.basename(path)) for path in new]
+                    parts = [load_solar_data(path) if part is None else part
+                             for path, part in zip(new, parts)]
+                except FileNotFoundError:
+                    continue
+                # Start over if the partition was compacted meanwhile
+                if os.stat(self.source).st_mtime_ns == mtime:
+                    break
+            # Names of segments deleted by a compaction can be forgotten
+            self._segments &= {os.path.basename(path) for path in segments}
+            version = (mtime, len(segments))    # partition_version() as listed
+            if not new:
+                if version != self.version:
+                    self.snapshot = self._restamped(version)
+                return self.version
+            rows = _sorted(pd.concat(parts) if len(parts) > 1 else parts[0])
+            self._extend(rows, version)
+            self._segments.update(os.path.basename(path) for path in new)
+            return self.version
+
+    def _restamped(self, version):
+        old = self.snapshot
+        return Snapshot(version, old.frame, old.metrics, old.rollups,
+                        old.bucket_stats, old.fx_version)
+
+    def _extend(self, rows, version):
+        """Replace the snapshot with its data plus a sorted frame of rows.
+
+        Rows that all come at or after the last one held are written into
+        the spare room of the in-memory columns (reallocated with
+        APPEND_HEADROOM to spare when it runs out); earlier rows mean a
+        re-sort of everything. metrics is derived from the extended frame,
+        so the two keep sharing their measurement columns, and cost_saved
+        is extended alongside them, so the FX lookup runs on the new rows
+        alone.
+        """
+        old = self.snapshot
+        cost_saved = derive_metrics(rows)['cost_saved']
+        columns = self._columns
+        n = len(old.frame) + len(rows)
+        capacity = n + int(n * APPEND_HEADROOM)
+        if len(old.frame) and rows.index[0] < old.frame.index[-1]:
+            frame = _sorted(pd.concat([old.frame, rows]))
+            cost = _sorted(pd.concat([old.metrics['cost_saved'], cost_saved]))
+            columns = _Columns(frame, cost, capacity)
+        else:
+            if columns is None or columns.spare < len(rows):
+                columns = _Columns(old.frame, old.metrics['cost_saved'],
+                                   capacity)
+            columns.write(rows, cost_saved)
+        self._columns = columns
+        frame, cost = columns.frames()
+        metrics = derive_metrics(frame, cost)
+        since = rows.index[0]
+        self.snapshot = Snapshot(
+            version, frame, metrics,
+            update_rollups(old.rollups, metrics, since),
+            update_bucket_stats(old.bucket_stats, metrics, since),
+            old.fx_version)
+
+    def compact(self, min_segments=COMPACT_SEGMENTS):
+        """Fold every segment into the base file once there are at least
+        min_segments; returns the number folded.
+
+        The new base file lists the segments it holds in its metadata and
+        replaces the old one atomically, and the segment files are deleted
+        after that: a store reading the partition in between skips the
+        segments the base already holds. Only one process compacts a
+        partition at a time, and only Arrow base files are rewritten.
+        """
+        if (not self.source.endswith(PARTITION_EXT)
+                or self.version[1] < min_segments):
+            return 0
+        with _try_lock(os.path.join(self.segment_dir, COMPACT_LOCK)) as locked:
+            if not locked:
+                return 0
+            self.refresh()
+            with self._lock:
+                old = self.snapshot
+                folded = sorted(self._segments)
+                if len(folded) < min_segments:
+                    return 0
+                frame = old.frame
+                chunk = {DATE_COLUMN: frame.index.to_numpy()}
+                chunk.update({col: frame[col].to_numpy()
+                              for col in MEASUREMENT_COLUMNS})
+                metadata = {FOLDED_KEY: json.dumps(folded),
+                            COMPACTED_FROM_KEY: str(old.version[0])}
+                try:
+                    write_store([chunk], self.source, metadata)
+                except OSError:
+                    # e.g. Windows won't replace a file another process maps
+                    log.exception("Could not compact %s", self.source)
+                    return 0
+                for name in folded:
+                    try:
+                        os.remove(os.path.join(self.segment_dir, name))
+                    except FileNotFoundError:
+                        pass
+                # Same data, now all in the base file; refresh() then picks
+                # up anything appended meanwhile and sets the version
+                self._segments = set(folded)
+                self.snapshot = self._restamped(
+                    (os.stat(self.source).st_mtime_ns, 0))
+            self.refresh()
+            return len(folded)
+
+    def append_records(self, records):
+        """Append a list of record dicts in the export schema"""
+        return self.append(records_to_frame(records))
+
+    def ingest_drop_dir(self):
+        """Append every JSON/CSV file waiting in the drop directory.
+
+        Only one process ingests a drop directory at a time; the others
+        skip it while DROP_LOCK is held. Each file's segment is named after
+        the file, so a file whose rows were appended just before a crash,
+        but which was never moved, is not appended twice. Processed files
+        are moved to the drop directory's processed/ folder; files that
+        can't be parsed are logged and moved to failed/. Returns the number
+        of rows appended.
+        """
+        if self.drop_dir is None or not os.path.isdir(self.drop_dir):
+            return 0
+        with _try_lock(os.path.join(self.drop_dir, DROP_LOCK)) as locked:
+            if not locked:
+                return 0
+            appended = 0
+            for name in sorted(os.listdir(self.drop_dir)):
+                path = os.path.join(self.drop_dir, name)
+                ext = os.path.splitext(name)[1].lower()
+                if ext not in RECORD_READERS or not os.path.isfile(path):
+                    continue
+                segment = f"{name}-{os.stat(path).st_mtime_ns}.parquet"
+                if not os.path.exists(os.path.join(self.segment_dir, segment)):
+                    try:
+                        rows = stream_solar_data(path)
+                    except Exception:
+                        log.exception("Could not ingest %s; moving it to %s/",
+                                      path, FAILED_DIR)
+                        self._move_dropped(name, FAILED_DIR)
+                        continue
+                    self.append(rows, segment)
+                    appended += len(rows)
+                self._move_dropped(name, PROCESSED_DIR)
+            return appended
+
+    def _move_dropped(self, name, folder):
+        folder = os.path.join(self.drop_dir, folder)
+        os.makedirs(folder, exist_ok=True)
+        shutil.move(os.path.join(self.drop_dir, name), os.path.join(folder, name))
+
+    def poll(self, interval=DROP_POLL_SECONDS):
+        """Pick up segments other processes appended, ingest dropped files
+        and compact the segments once there are enough, at most once per
+        interval seconds.
+
+        Cheap enough to call on every dashboard rerun; concurrent callers
+        skip rather than wait while another one is ingesting.
+        """
+        if not self._poll_lock.acquire(blocking=False):
+            return 0
+        try:
+            now = time.monotonic()
+            if now - self._last_poll < interval:
+                return 0
+            self._last_poll = now
+            self.refresh()
+            appended = self.ingest_drop_dir()
+            self.compact()
+            return appended
+        finally:
+            self._poll_lock.release()
+
+
+def fleet_snapshot(snapshots):
+    """Fleet-wide view built from per-site rollups, never from raw rows.
+
+    metrics holds one row per day with fleet totals of energy, CO2 and
+    savings and the fleet mean irradiance; rollups and bucket statistics are
+    built over that daily series. version and fx_version are the tuples of
+    the sites'.
+    """
+    daily = merge_rollups([s.rollups['daily'] for s in snapshots])
+    metrics = chart_frame(daily)
+    return Snapshot(tuple(s.version for s in snapshots), None, metrics,
+                    build_rollups(metrics), build_bucket_stats(metrics),
+                    tuple(s.fx_version for s in snapshots))
@@ -0,0 +1,197 @@
+import numpy as np
+import pandas as pd
+
+from solar_data import select_window
+
+SUMMARY_COLUMNS = ['energy_kwh', 'co2_saved_kg', 'cost_saved']
+SUMMARY_PERCENTILES = (0.25, 0.5, 0.75)
+
+# Bucket size the statistics are kept at (a fixed frequency such as "1D" or
+# "1h", matching the finest rollup)
+STATS_BUCKET = "1D"
+
+# t-digest compression: roughly the max number of centroids per digest.
+# Higher is more accurate and larger.
+DIGEST_COMPRESSION = 100
+
+
+def _k_scale(q, compression):
+    """t-digest k1 scale function: small clusters near the tails"""
+    return compression / (2 * np.pi) * np.arcsin(2 * q - 1)
+
+
+def _cluster(group, values, weights, compression):
+    """Merge sorted centroids into t-digest clusters, group by group.
+
+    group must be non-decreasing and values sorted within each group.
+    Returns (group, means, weights) of the merged centroids, still sorted.
+    """
+    n_groups = group[-1] + 1 if len(group) else 0
+    totals = np.bincount(group, weights, minlength=n_groups)
+    cum = np.cumsum(weights)
+    group_start = np.concatenate([[0.0], np.cumsum(totals)[:-1]])
+    q = (cum - weights / 2 - group_start[group]) / totals[group]
+    k = np.floor(_k_scale(q, compression) - _k_scale(0.0, compression))
+
+    new = np.ones(len(group), dtype=bool)
+    new[1:] = (group[1:] != group[:-1]) | (k[1:] != k[:-1])
+    ids = np.cumsum(new) - 1
+    w = np.bincount(ids, weights)
+    m = np.bincount(ids, weights * values) / w
+    return group[new], m, w
+
+
+def merge_digest(means, weights, compression=DIGEST_COMPRESSION):
+    """Merge any number of centroids into a single digest"""
+    order = np.argsort(means, kind="stable")
+    group = np.zeros(len(means), dtype=np.int64)
+    _, m, w = _cluster(group, means[order], weights[order], compression)
+    return m, w
+
+
+def digest_quantiles(means, weights, vmin, vmax, qs):
+    """Estimate quantiles from sorted digest centroids and exact min/max"""
+    total = weights.sum()
+    centers = np.cumsum(weights) - weights / 2
+    xp = np.concatenate([[0.0], centers, [total]])
+    fp = np.concatenate([[vmin], means, [vmax]])
+    return np.interp(np.asarray(qs) * total, xp, fp)
+
+
+class BucketStats:
+    """Mergeable per-bucket statistics for one column.
+
+    Per bucket: exact count, mean, M2 (sum of squared deviations), min and
+    max, plus a t-digest stored as one flat centroid array with offsets.
+    Buckets with no values are not stored.
+    """
+
+    def __init__(self, values, bucket_keys, compression=DIGEST_COMPRESSION):
+        valid = ~np.isnan(values)
+        keys, values = bucket_keys[valid], values[valid].astype(np.float64)
+        self.buckets, bucket = np.unique(keys, return_inverse=True)
+        bucket = bucket.astype(np.int64)
+
+        # Sort by bucket, then value: each bucket becomes a sorted run
+        order = np.lexsort((values, bucket))
+        bucket, values = bucket[order], values[order]
+        n_buckets = len(self.buckets)
+
+        self.count = np.bincount(bucket, minlength=n_buckets)
+        self.mean = np.bincount(bucket, values, minlength=n_buckets) / self.count
+        self.m2 = np.bincount(bucket, (values - self.mean[bucket]) ** 2,
+                              minlength=n_buckets)
+        ends = np.cumsum(self.count)
+        self.min = values[ends - self.count] if n_buckets else values[:0]
+        self.max = values[ends - 1] if n_buckets else values[:0]
+
+        owner, self.centroids, self.weights = _cluster(
+            bucket, values, np.ones(len(values)), compression)
+        self.offsets = np.searchsorted(owner, np.arange(n_buckets + 1))
+
+    def spliced(self, tail):
+        """These stats with every bucket from tail's first bucket on replaced
+        by tail's buckets. Returns a new BucketStats."""
+        if not len(tail.buckets):
+            return self
+        keep = self.buckets.searchsorted(tail.buckets[0], side="left")
+        cut = self.offsets[keep]
+        merged = object.__new__(BucketStats)
+        merged.buckets = np.concatenate([self.buckets[:keep], tail.buckets])
+        for name in ("count", "mean", "m2", "min", "max"):
+            setattr(merged, name, np.concatenate(
+                [getattr(self, name)[:keep], getattr(tail, name)]))
+        merged.centroids = np.concatenate([self.centroids[:cut], tail.centroids])
+        merged.weights = np.concatenate([self.weights[:cut], tail.weights])
+        merged.offsets = np.concatenate([self.offsets[:keep], tail.offsets + cut])
+        return merged
+
+
+def build_bucket_stats(df, columns=SUMMARY_COLUMNS, rule=STATS_BUCKET,
+                       compression=DIGEST_COMPRESSION):
+    """Build BucketStats for each column, bucketed by a fixed frequency.
+
+    Returns {column: BucketStats}; bucket keys are bucket start timestamps.
+    """
+    keys = df.index.floor(rule).to_numpy()
+    return {
+        col: BucketStats(df[col].to_numpy(dtype=np.float64), keys, compression)
+        for col in columns
+    }
+
+
+def update_bucket_stats(bucket_stats, df, since, rule=STATS_BUCKET,
+                        compression=DIGEST_COMPRESSION):
+    """Refresh bucket stats after rows at or after since were added to df.
+
+    Only the buckets from the one containing since onwards are rebuilt.
+    Returns a new dict.
+    """
+    cutoff = pd.Timestamp(since).floor(rule)
+    tail = build_bucket_stats(select_window(df, cutoff), list(bucket_stats),
+                              rule, compression)
+    return {col: stats.spliced(tail[col]) for col, stats in bucket_stats.items()}
+
+
+def _combine(counts, means, m2s):
+    """Chan et al. parallel merge of (count, mean, M2) partials"""
+    n = counts.sum()
+    if n == 0:
+        return 0, np.nan, np.nan
+    mean = (counts * means).sum() / n
+    m2 = m2s.sum() + (counts * (means - mean) ** 2).sum()
+    return n, mean, m2
+
+
+def _column_summary(stats, lo, hi, extra, percentiles, compression):
+    """describe()-style figures for buckets lo:hi plus raw values extra"""
+    extra = extra[~np.isnan(extra)]
+    counts = np.append(stats.count[lo:hi], len(extra))
+    means = np.append(stats.mean[lo:hi], extra.mean() if len(extra) else 0.0)
+    m2s = np.append(stats.m2[lo:hi],
+                    ((extra - extra.mean()) ** 2).sum() if len(extra) else 0.0)
+    n, mean, m2 = _combine(counts, means, m2s)
+    if n == 0:
+        return [0.0, np.nan, np.nan, np.nan] + [np.nan] * len(percentiles) + [np.nan]
+
+    vmin = min(stats.min[lo:hi].min(initial=np.inf), extra.min(initial=np.inf))
+    vmax = max(stats.max[lo:hi].max(initial=-np.inf), extra.max(initial=-np.inf))
+    a, b = stats.offsets[lo], stats.offsets[hi]
+    c_means = np.concatenate([stats.centroids[a:b], extra])
+    c_weights = np.concatenate([stats.weights[a:b], np.ones(len(extra))])
+    d_means, d_weights = merge_digest(c_means, c_weights, compression)
+    quantiles = digest_quantiles(d_means, d_weights, vmin, vmax, percentiles)
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    return [float(n), mean, std, vmin, *quantiles, vmax]
+
+
+def window_summary(bucket_stats, df, start=None, end=None, rule=STATS_BUCKET,
+                   percentiles=SUMMARY_PERCENTILES,
+                   compression=DIGEST_COMPRESSION):
+    """Summary of df over [start, end) in the shape of DataFrame.describe().
+
+    Whole buckets inside the window are merged from bucket_stats; only the
+    rows of the partial buckets at either edge are read from df. count,
+    mean, std, min and max are exact, percentiles are t-digest estimates.
+    """
+    step = pd.Timedelta(rule)
+    rows = ["count", "mean", "std", "min"]
+    rows += [f"{p * 100:g}%" for p in percentiles] + ["max"]
+    summary = {}
+    for col, stats in bucket_stats.items():
+        buckets = stats.buckets
+        lo = 0 if start is None else buckets.searchsorted(
+            np.datetime64(pd.Timestamp(start)), side="left")
+        hi = len(buckets) if end is None else buckets.searchsorted(
+            np.datetime64(pd.Timestamp(end) - step), side="right")
+        if hi <= lo:
+            lo = hi = 0
+            edges = select_window(df, start, end)[col]
+        else:
+            head = select_window(df, start, buckets[lo])[col]
+            tail = select_window(df, buckets[hi - 1] + step, end)[col]
+            edges = pd.concat([head, tail])
+        summary[col] = _column_summary(
+            stats, lo, hi, edges.to_numpy(dtype=np.float64), percentiles,
+            compression)
+    return pd.DataFrame(summary, index=rows)
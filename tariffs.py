@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+
+# Month numbers of each season, for tariffs priced by season
+SUMMER = (4, 5, 6, 7, 8, 9)
+WINTER = (10, 11, 12, 1, 2, 3)
+WEEKDAYS = (0, 1, 2, 3, 4)
+WEEKEND = (5, 6)
+
+
+class Tariff:
+    """Electricity tariff used to value generated energy.
+
+    The time-of-use part is a rate ($/kWh) for every (month, day of week,
+    hour) held in a 12 x 7 x 24 lookup array: base_rate everywhere, then
+    each period (rate, hours, days, months) overwrites the slots it covers,
+    later periods winning; None in a period means "all". tiers are
+    (upper kWh, $/kWh) bands of the energy used so far in the calendar
+    month, added on top of the time-of-use rate; the last band's upper
+    bound may be None. A purely tiered tariff has base_rate 0.
+
+    Tariffs compare and hash by definition, so results can be cached per
+    tariff.
+    """
+
+    def __init__(self, name, base_rate, periods=(), tiers=()):
+        self.name = name
+        self.base_rate = float(base_rate)
+        self.periods = tuple(
+            (float(rate), _slots(hours), _slots(days), _slots(months))
+            for rate, hours, days, months in periods)
+        self.tiers = tuple((None if upper is None else float(upper), float(rate))
+                           for upper, rate in tiers)
+
+        table = np.full((12, 7, 24), self.base_rate)
+        for rate, hours, days, months in self.periods:
+            m = slice(None) if months is None else [x - 1 for x in months]
+            d = slice(None) if days is None else list(days)
+            h = slice(None) if hours is None else list(hours)
+            table[np.ix_(*(np.arange(n)[s] for n, s in
+                           ((12, m), (7, d), (24, h))))] = rate
+        self.table = table
+
+    @classmethod
+    def flat(cls, rate):
+        return cls(f"${rate:.2f}/kWh", rate)
+
+    @property
+    def key(self):
+        """The tariff's definition as a plain tuple"""
+        return (self.base_rate, self.periods, self.tiers)
+
+    def __eq__(self, other):
+        return isinstance(other, Tariff) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return f"Tariff({self.name!r})"
+
+    def rates(self, index):
+        """Time-of-use rate ($/kWh) at every timestamp of a DatetimeIndex"""
+        return self.table[index.month.to_numpy() - 1,
+                          index.dayofweek.to_numpy(),
+                          index.hour.to_numpy()]
+
+    def value(self, energy):
+        """Value ($) of each row of a kWh series under this tariff"""
+        kwh = energy.to_numpy(dtype=np.float64)
+        value = kwh * self.rates(energy.index)
+        if self.tiers:
+            value += _tier_charges(energy.index, kwh, self.tiers)
+        return pd.Series(value, index=energy.index, name=energy.name)
+
+
+def _slots(values):
+    return None if values is None else tuple(sorted(values))
+
+
+def _tier_charges(index, kwh, tiers):
+    """Tier charge per row: the tiered cost of the month's running total
+    after the row minus before it, so a row straddling a band boundary is
+    split between the bands"""
+    # Running total within each calendar month (rows are in time order)
+    month = index.year.to_numpy() * 12 + index.month.to_numpy()
+    starts = np.flatnonzero(np.r_[True, month[1:] != month[:-1]])
+    total = np.cumsum(kwh)
+    before_month = np.repeat(total[starts] - kwh[starts],
+                             np.diff(np.r_[starts, len(kwh)]))
+    after = total - before_month
+    before = after - kwh
+
+    def charge(used):
+        cost = np.zeros(len(used))
+        lower = 0.0
+        for upper, rate in tiers:
+            top = np.inf if upper is None else upper
+            cost += rate * np.clip(used - lower, 0, top - lower)
+            lower = top
+        return cost
+
+    return charge(after) - charge(before)
+
+
+# Tariffs offered in the dashboard besides a flat rate
+TARIFFS = {
+    "Time of use": Tariff("Time of use", 0.12, periods=[
+        (0.08, range(0, 7), None, None),            # off-peak nights
+        (0.22, range(16, 21), WEEKDAYS, WINTER),    # winter weekday peak
+        (0.30, range(14, 20), WEEKDAYS, SUMMER),    # summer weekday peak
+    ]),
+    "Tiered": Tariff("Tiered", 0.0, tiers=[
+        (300, 0.10), (800, 0.16), (None, 0.24),
+    ]),
+}
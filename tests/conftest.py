@@ -0,0 +1,46 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# The modules live flat at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rollups import ROLLUP_COLUMNS  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def metrics():
+    """About three years of irregular synthetic metrics: duplicate
+    timestamps, a two-month gap (so some buckets are empty) and a few
+    missing cost_saved values"""
+    rng = np.random.default_rng(0)
+    minutes = np.sort(rng.integers(0, 3 * 365 * 1440, 20_000))
+    index = pd.Timestamp("2022-01-01") + pd.to_timedelta(minutes, unit="min")
+    index = index[(index < "2023-03-01") | (index >= "2023-05-01")]
+    df = pd.DataFrame(
+        {col: rng.gamma(2.0, 1.0, len(index)).astype(np.float32)
+         for col in ROLLUP_COLUMNS},
+        index=pd.DatetimeIndex(index, name="Date"))
+    df.loc[df.index[rng.integers(0, len(df), 50)], 'cost_saved'] = np.nan
+    return df
+
+
+def random_windows(df, n, seed):
+    """n (start, end) windows over df's span and a little beyond: some
+    aligned to midnight or month starts, some open on one side"""
+    rng = np.random.default_rng(seed)
+    first, span = df.index[0], df.index[-1] - df.index[0]
+    windows = []
+    for _ in range(n):
+        start, end = (first + span * f for f in np.sort(rng.uniform(-0.05, 1.05, 2)))
+        align = rng.integers(0, 3)
+        if align == 1:
+            start, end = start.floor("D"), end.floor("D")
+        elif align == 2:
+            start, end = (ts.to_period("M").to_timestamp() for ts in (start, end))
+        windows.append((None if rng.random() < 0.1 else start,
+                        None if rng.random() < 0.1 else end))
+    return windows
@@ -0,0 +1,62 @@
+import asyncio
+import json
+
+import pytest
+
+from api import QueryAPI
+
+
+def exchange(*requests):
+    """Send raw requests on one connection; returns every response read
+    until the server closes it, as (status, body) pairs"""
+    async def run():
+        server = await asyncio.start_server(QueryAPI().serve_connection,
+                                            "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for request in requests:
+                writer.write(request)
+            await writer.drain()
+            responses = []
+            while line := await reader.readline():
+                status = int(line.split()[1])
+                headers = {}
+                while (header := await reader.readline()) != b"\r\n":
+                    name, _, value = header.decode().partition(":")
+                    headers[name.lower()] = value.strip()
+                body = await reader.readexactly(int(headers["content-length"]))
+                responses.append((status, json.loads(body)))
+            writer.close()
+            return responses
+    return asyncio.run(run())
+
+
+GET_SITES = b"GET /sites HTTP/1.1\r\nHost: x\r\n\r\n"
+
+
+def test_keep_alive_answers_every_request():
+    responses = exchange(GET_SITES, GET_SITES,
+                         b"GET /nope HTTP/1.1\r\nConnection: close\r\n\r\n")
+    assert [status for status, _ in responses] == [200, 200, 404]
+    assert "sites" in responses[0][1]
+
+
+@pytest.mark.parametrize("request_head, error", [
+    (b"GET /sites HTTP/1.1\r\nContent-Length: lots\r\n\r\n",
+     "Malformed Content-Length"),
+    (b"GET /sites HTTP/1.1\r\nContent-Length: 1000000000\r\n\r\n",
+     "Request bodies are not accepted"),
+    (b"GET /sites HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n",
+     "Request bodies are not accepted"),
+    (b"GET /sites HTTP/1.1\r\nX-Big: " + b"a" * 70_000 + b"\r\n\r\n",
+     "too long"),
+    (b"GET /sites HTTP/1.1\r\n" + b"X: y\r\n" * 101 + b"\r\n",
+     "Too many headers"),
+    (b"GET\r\n\r\n", "Malformed request line"),
+])
+def test_bad_requests_get_400_and_close(request_head, error):
+    responses = exchange(request_head, GET_SITES)
+    assert len(responses) == 1
+    status, body = responses[0]
+    assert status == 400 and error in body["error"]
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from downsample import downsample, downsample_many, lttb_indices, minmax_indices
+
+
+def lttb_reference(x, y, n_out):
+    """Textbook LTTB (Steinarsson 2013), one point at a time"""
+    n = len(x)
+    every = (n - 2) / (n_out - 2)
+    out, a = [0], 0
+    for i in range(n_out - 2):
+        lo, hi = int(i * every) + 1, int((i + 1) * every) + 1
+        next_lo, next_hi = hi, min(int((i + 2) * every) + 1, n)
+        avg_x = sum(x[next_lo:next_hi]) / (next_hi - next_lo)
+        avg_y = sum(y[next_lo:next_hi]) / (next_hi - next_lo)
+        best, best_area = lo, -1.0
+        for j in range(lo, hi):
+            area = abs((x[a] - avg_x) * (y[j] - y[a])
+                       - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        out.append(best)
+        a = best
+    return out + [n - 1]
+
+
+def series(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.arange(n, dtype=np.float64), np.cumsum(rng.normal(size=n))
+
+
+@pytest.mark.parametrize("n, n_out", [(10, 3), (100, 7), (1000, 100),
+                                      (1001, 999), (5000, 64)])
+def test_lttb_matches_reference(n, n_out):
+    x, y = series(n)
+    assert lttb_indices(x, y, n_out).tolist() == lttb_reference(x, y, n_out)
+
+
+def test_lttb_keeps_everything_when_within_budget():
+    x, y = series(50)
+    assert lttb_indices(x, y, 50).tolist() == list(range(50))
+    assert lttb_indices(x, y, 2).tolist() == list(range(50))
+
+
+def test_lttb_skips_nan_unless_bucket_is_all_nan():
+    x, y = series(1000)
+    y[100:300] = np.nan
+    keep = lttb_indices(x, y, 100)
+    assert len(keep) == 100 and np.all(np.diff(keep) > 0)
+    # Buckets with any real value pick one
+    every = 998 / 98
+    for i, pos in enumerate(keep[1:-1]):
+        lo, hi = int(i * every) + 1, int((i + 1) * every) + 1
+        if not np.isnan(y[lo:hi]).all():
+            assert not np.isnan(y[pos])
+
+
+@pytest.mark.parametrize("n, n_out", [(1000, 10), (1000, 101), (997, 64)])
+def test_minmax_keeps_every_bucket_extreme(n, n_out):
+    _, y = series(n, seed=1)
+    y[::97] = np.nan
+    keep = minmax_indices(y, n_out)
+    assert keep[0] == 0 and keep[-1] == n - 1
+    assert np.all(np.diff(keep) > 0) and len(keep) <= n_out + 2
+    size = -(-n // (n_out // 2))
+    for lo in range(0, n, size):
+        bucket = y[lo:lo + size]
+        assert lo + np.nanargmin(bucket) in keep
+        assert lo + np.nanargmax(bucket) in keep
+
+
+def frame(n):
+    _, y = series(n, seed=2)
+    return pd.DataFrame({'a': y, 'b': -y[::-1]},
+                        index=pd.date_range("2024-01-01", periods=n, freq="min"))
+
+
+@pytest.mark.parametrize("mode", ["lttb", "minmax"])
+def test_downsample_returns_a_subset_in_order(mode):
+    df = frame(5000)
+    out = downsample(df, 'a', 200, mode)
+    assert len(out) <= 202 and out.index.is_monotonic_increasing
+    pd.testing.assert_frame_equal(out, df.loc[out.index])
+    assert downsample(df, 'a', 5000, mode) is df
+
+
+def test_downsample_many_keeps_each_columns_extremes():
+    df = frame(5000)
+    out = downsample_many(df, ['a', 'b'], 200, "minmax")
+    assert len(out) <= 204 and out.index.is_unique
+    for col in ['a', 'b']:
+        assert out[col].max() == df[col].max()
+        assert out[col].min() == df[col].min()
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError, match="Unknown downsampling mode"):
+        downsample(frame(100), 'a', 10, "every_nth")
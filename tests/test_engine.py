@@ -0,0 +1,23 @@
+from types import SimpleNamespace
+
+import pandas as pd
+
+from conftest import random_windows
+from engine import chart_source
+from rollups import build_rollups, chart_frame
+
+
+def test_chart_rollups_only_hold_rows_in_the_window(metrics):
+    snapshot = SimpleNamespace(metrics=metrics, rollups=build_rollups(metrics))
+    for start, end in random_windows(metrics, 40, seed=3):
+        data, granularity = chart_source("site", snapshot, start, end, 20)
+        rows = metrics.loc[start:end]
+        if granularity is None:
+            pd.testing.assert_frame_equal(data, rows)
+            continue
+        expected = chart_frame(build_rollups(rows)[granularity])
+        if start is not None:
+            assert data.index[0] >= start
+            expected.index = expected.index.where(expected.index >= start, start)
+        pd.testing.assert_frame_equal(data, expected, check_freq=False,
+                                      rtol=1e-5)
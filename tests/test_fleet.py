@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import fleet
+import sites
+from fleet import fleet_kpis, kpi_table, window_partial
+from solar_data import DATE_COLUMN, MEASUREMENT_COLUMNS, write_store
+from store import SolarStore
+
+
+@pytest.fixture
+def site_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(sites, "SITES_DIR", str(tmp_path))
+    monkeypatch.setattr(fleet, "_results", type(fleet._results)())
+    for i in range(5):
+        rng = np.random.default_rng(i)
+        n = 300 + 50 * i
+        chunk = {DATE_COLUMN: pd.date_range("2024-01-01", periods=n,
+                                            freq="h").to_numpy()}
+        chunk.update({col: rng.gamma(2.0, 5.0, n) for col in MEASUREMENT_COLUMNS})
+        write_store([chunk], sites.site_source(f"site{i}"))
+    return tmp_path
+
+
+def expected(names, start, end):
+    stores = [SolarStore(sites.site_source(site)) for site in names]
+    return kpi_table(names, [window_partial(s.snapshot.metrics, start, end)
+                             for s in stores])
+
+
+def assert_kpis_equal(result, names, start=None, end=None):
+    per_site, totals = expected(names, start, end)
+    pd.testing.assert_frame_equal(result[0], per_site)
+    pd.testing.assert_series_equal(result[1], totals)
+
+
+def test_fleet_kpis_from_disk(site_dir):
+    start, end = pd.Timestamp("2024-01-03"), pd.Timestamp("2024-01-10 06:00")
+    assert_kpis_equal(fleet_kpis(start=start, end=end), sites.list_sites(),
+                      start, end)
+    assert fleet_kpis(start=start, end=end) is fleet_kpis(start=start, end=end)
+
+
+def test_loaded_snapshots_are_not_read_from_disk(site_dir, monkeypatch):
+    names = sites.list_sites()
+    snapshots = {site: SolarStore(sites.site_source(site)).snapshot
+                 for site in names[:3]}
+    loads = []
+    load = fleet._load_metrics
+    monkeypatch.setattr(fleet, "_load_metrics",
+                        lambda source: loads.append(source) or load(source))
+    assert_kpis_equal(fleet_kpis(snapshots=snapshots), names)
+    assert loads == [sites.site_source(site) for site in names[3:]]
+
+
+def test_sites_keep_their_worker():
+    names = [f"site{i}" for i in range(200)]
+    shares = [fleet._worker_for(site, 8) for site in names]
+    assert shares == [fleet._worker_for(site, 8) for site in names]
+    assert set(shares) == set(range(8))
+
+
+def test_pool_matches_in_process(site_dir, monkeypatch):
+    monkeypatch.setattr(fleet, "PARALLEL_MIN_SITES", 2)
+    assert_kpis_equal(fleet_kpis(end="2024-01-12"), sites.list_sites(),
+                      end=pd.Timestamp("2024-01-12"))
+
+
+def test_fx_table_change_invalidates_results(site_dir, monkeypatch):
+    first = fleet_kpis()
+    assert fleet_kpis() is first
+    monkeypatch.setattr(fleet, "fx_version", lambda: -1)
+    assert fleet_kpis() is not first
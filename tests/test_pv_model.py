@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+
+from pv_model import expected_energy, row_hours
+
+
+def test_row_hours_are_capped_at_the_nominal_interval():
+    index = pd.DatetimeIndex(["2024-01-01 00:00", "2024-01-01 01:00",
+                              "2024-01-01 02:00", "2024-01-03 02:00",
+                              "2024-01-03 02:30", "2024-01-03 03:30"])
+    np.testing.assert_array_equal(row_hours(index), [1, 1, 1, 0.5, 1, 1])
+    assert row_hours(index[:1]).tolist() == [24.0]
+
+
+def test_outage_does_not_inflate_expected_energy():
+    index = pd.date_range("2024-06-01", periods=48, freq="h")
+    df = pd.DataFrame({'Solar_Irradiance_W/m2': 500.0,
+                       'Panel_Temperature_C': 25.0,
+                       'Cloud_Cover_%': 0.0}, index=index)
+    full = expected_energy(df, 5.0, 0.2)
+    gappy = expected_energy(df.drop(index[10:40]), 5.0, 0.2)
+    # Every remaining row still covers one hour
+    np.testing.assert_allclose(gappy.to_numpy(), full.iloc[0])
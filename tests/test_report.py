@@ -0,0 +1,52 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import sites
+from report import parse_window, run_report, window_label
+from solar_data import DATE_COLUMN, MEASUREMENT_COLUMNS, write_store
+
+
+def test_parse_window_accepts_times_of_day():
+    assert parse_window("2024-01-01T06:00:2024-01-01T18:00") == (
+        pd.Timestamp("2024-01-01 06:00"), pd.Timestamp("2024-01-01 18:00"))
+    assert parse_window("2024-01-01:") == (pd.Timestamp("2024-01-01"), None)
+    assert parse_window(":") == (None, None)
+    with pytest.raises(ValueError):
+        parse_window("2024-13-01:2024-02-01")
+
+
+def test_window_labels_keep_time_of_day():
+    morning = parse_window("2024-01-01T06:00:2024-01-01T12:00")
+    afternoon = parse_window("2024-01-01T12:00:2024-01-01T18:00")
+    assert window_label(*morning) != window_label(*afternoon)
+    assert ":" not in window_label(*morning)
+    assert window_label(None, None) == "all"
+
+
+@pytest.fixture
+def site_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(sites, "SITES_DIR", str(tmp_path / "sites"))
+    os.makedirs(sites.SITES_DIR)
+    return tmp_path
+
+
+def test_run_report_checks_sites(site_dir):
+    with pytest.raises(ValueError, match="No sites to report on"):
+        run_report(out_dir=str(site_dir / "out"))
+    n = 200
+    chunk = {DATE_COLUMN: pd.date_range("2024-01-01", periods=n,
+                                        freq="h").to_numpy()}
+    chunk.update({col: np.ones(n) for col in MEASUREMENT_COLUMNS})
+    write_store([chunk], sites.site_source("north"))
+    with pytest.raises(ValueError, match="Unknown sites: nope; .*north"):
+        run_report(["north", "nope"], out_dir=str(site_dir / "out"))
+
+    written = run_report(windows=[parse_window("2024-01-02:2024-01-05")],
+                         granularities=["daily"], out_dir=str(site_dir / "out"))
+    assert [os.path.basename(path) for path in written] == [
+        "metrics.csv", "summary_2024-01-02T000000_2024-01-05T000000.csv",
+        "daily_2024-01-02T000000_2024-01-05T000000.csv"]
+    assert pd.read_csv(written[0])['rows'].tolist() == [72]
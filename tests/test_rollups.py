@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from conftest import random_windows
+from rollups import (GRANULARITIES, ROLLUP_COLUMNS, ROLLUP_STATS,
+                     build_rollups, choose_granularity, merge_rollups,
+                     update_rollups, window_rollup)
+from solar_data import select_window
+
+# Bucket start of each timestamp, worked out independently of resample
+BUCKET_STARTS = {
+    "daily": lambda index: index.normalize(),
+    # "W" buckets run Sunday to Saturday
+    "weekly": lambda index: index.normalize() - pd.to_timedelta(
+        (index.dayofweek + 1) % 7, unit="D"),
+    "monthly": lambda index: index.to_period("M").to_timestamp(),
+    "yearly": lambda index: index.to_period("Y").to_timestamp(),
+}
+
+
+@pytest.mark.parametrize("name", list(GRANULARITIES))
+def test_build_rollups_matches_groupby(metrics, name):
+    rollup = build_rollups(metrics)[name]
+    expected = metrics[ROLLUP_COLUMNS].groupby(
+        BUCKET_STARTS[name](metrics.index)).agg(ROLLUP_STATS)
+    pd.testing.assert_frame_equal(rollup, expected, check_freq=False,
+                                  check_names=False, rtol=1e-5)
+    # Empty buckets (the gap in the fixture) are dropped
+    assert (rollup[(ROLLUP_COLUMNS[0], 'count')] > 0).all()
+
+
+@pytest.mark.parametrize("name", list(GRANULARITIES))
+def test_window_rollup_matches_rollup_of_window(metrics, name):
+    rollup = build_rollups(metrics)[name]
+    for start, end in random_windows(metrics, 30, seed=1):
+        expected = build_rollups(select_window(metrics, start, end))[name]
+        result = window_rollup(rollup, metrics, GRANULARITIES[name], start, end)
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+
+
+def test_choose_granularity_picks_coarsest_with_enough_points(metrics):
+    rollups = build_rollups(metrics)
+    assert choose_granularity(rollups, min_points=30) == "monthly"
+    assert choose_granularity(rollups, min_points=100) == "weekly"
+    assert choose_granularity(rollups, min_points=10_000) is None
+    start = metrics.index[-1] - pd.Timedelta(days=20)
+    assert choose_granularity(rollups, start, min_points=15) == "daily"
+
+
+def test_update_rollups_matches_rebuild(metrics):
+    # Appended in pieces, one of them reaching back before the last row
+    cuts = [len(metrics) // 2, 3 * len(metrics) // 4, len(metrics)]
+    df = metrics.iloc[:cuts[0]]
+    rollups = build_rollups(df)
+    for lo, hi in zip(cuts, cuts[1:]):
+        rows = metrics.iloc[lo:hi]
+        late = metrics.iloc[lo - 100:lo - 90]
+        df = pd.concat([df, rows, late]).sort_index(kind="stable")
+        rollups = update_rollups(rollups, df, min(rows.index[0], late.index[0]))
+    expected = build_rollups(df)
+    for name in GRANULARITIES:
+        pd.testing.assert_frame_equal(rollups[name], expected[name],
+                                      check_freq=False)
+
+
+def test_merge_rollups_matches_rollup_of_combined(metrics):
+    north = metrics.iloc[::2]
+    south = metrics.iloc[1::2].shift(freq="17min")
+    combined = pd.concat([north, south]).sort_index(kind="stable")
+    for name in GRANULARITIES:
+        merged = merge_rollups([build_rollups(north)[name],
+                                build_rollups(south)[name]])
+        expected = build_rollups(combined)[name]
+        pd.testing.assert_frame_equal(merged, expected[merged.columns],
+                                      check_freq=False, check_dtype=False,
+                                      rtol=1e-5)
@@ -0,0 +1,111 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from solar_data import (DATE_COLUMN, MEASUREMENT_COLUMNS, convert_export,
+                        iter_json_records, load_arrow, load_solar_data,
+                        records_to_frame, stream_solar_data)
+
+
+def telemetry(n, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2024-01-01", periods=n, freq="37min")
+    return [{DATE_COLUMN: ts.isoformat(),
+             **{col: round(float(v), 3) for col, v in
+                zip(MEASUREMENT_COLUMNS, rng.gamma(2.0, 50.0, len(MEASUREMENT_COLUMNS)))}}
+            for ts in dates]
+
+
+def write(tmp_path, text, name="export.json"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+# Strings, escapes and numbers that a read buffer can cut in half
+TRICKY = """ [
+  {"a": "caf\\u00e9 \\"quoted\\" \\\\ \\n", "b": -12.5e-3, "c": [true, false, null]},
+  {"d": {"nested": [1, 2.0, 3e10]}, "e": "\\ud83d\\ude00", "f": 1234567890123},
+  {}, [], "text", 0, -0.0, 1e308,
+  {"g": "ééé", "h": true}
+]
+"""
+
+
+@pytest.mark.parametrize("buffer_size", range(1, 40))
+def test_records_match_json_load_at_every_buffer_size(tmp_path, buffer_size):
+    path = write(tmp_path, TRICKY)
+    assert list(iter_json_records(path, buffer_size)) == json.loads(TRICKY)
+
+
+@pytest.mark.parametrize("text", ["[]", " [ ] \n", "[\n]\n\n"])
+def test_empty_array(tmp_path, text):
+    assert list(iter_json_records(write(tmp_path, text), buffer_size=1)) == []
+
+
+@pytest.mark.parametrize("text, message, at", [
+    ('[{"a": 1} {"b": 2}]', "Expected ',' or ']'", 10),
+    ('[{"a": 1},, {"b": 2}]', "Malformed JSON record", 10),
+    ('[{"a": 1},]', "Malformed JSON record", 10),
+    ('[{"a": tru}]', "Malformed JSON record", 7),
+    ('[{"a": 1}] trailing', "Unexpected data after the JSON array", 11),
+    ('[{"a": 1}]\n\n  ]', "Unexpected data after the JSON array", 14),
+])
+@pytest.mark.parametrize("buffer_size", [1, 3, 64])
+def test_malformed_input_reports_path_and_offset(tmp_path, text, message, at,
+                                                 buffer_size):
+    path = write(tmp_path, text)
+    with pytest.raises(ValueError, match=message) as err:
+        list(iter_json_records(path, buffer_size))
+    assert path in str(err.value)
+    assert f"at char {at}" in str(err.value)
+
+
+@pytest.mark.parametrize("text", ['[{"a": 1}', '[{"a": 1},', '[{"a": "x', ''])
+def test_truncated_file(tmp_path, text):
+    with pytest.raises(ValueError, match="JSON"):
+        list(iter_json_records(write(tmp_path, text), buffer_size=2))
+
+
+def test_not_an_array(tmp_path):
+    with pytest.raises(ValueError, match="Expected a JSON array"):
+        list(iter_json_records(write(tmp_path, '{"a": 1}')))
+
+
+def test_record_longer_than_limit(tmp_path):
+    path = write(tmp_path, '[{"a": "' + "x" * 1000 + '"}]')
+    with pytest.raises(ValueError, match="longer than 100 characters"):
+        list(iter_json_records(path, buffer_size=16, max_record_chars=100))
+    assert list(iter_json_records(path, buffer_size=16))[0]["a"] == "x" * 1000
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100_000])
+def test_stream_solar_data_matches_records(tmp_path, chunk_size):
+    records = telemetry(50)
+    expected = records_to_frame(records)
+    json_path = write(tmp_path, json.dumps(records))
+    pd.testing.assert_frame_equal(stream_solar_data(json_path, chunk_size), expected)
+    csv_path = str(tmp_path / "export.csv")
+    pd.DataFrame(records).to_csv(csv_path, index=False)
+    pd.testing.assert_frame_equal(stream_solar_data(csv_path, chunk_size), expected)
+
+
+def test_json_exports_load_through_the_streaming_reader(tmp_path, monkeypatch):
+    path = write(tmp_path, json.dumps(telemetry(10)))
+    monkeypatch.setattr(json, "load", None)
+    assert len(load_solar_data(path)) == 10
+
+
+def test_empty_export(tmp_path):
+    df = stream_solar_data(write(tmp_path, "[]"))
+    assert len(df) == 0 and list(df.columns[:-1]) == MEASUREMENT_COLUMNS
+
+
+def test_convert_export_round_trips(tmp_path):
+    records = telemetry(50)
+    store = str(tmp_path / "site.arrow")
+    assert convert_export(write(tmp_path, json.dumps(records)), store,
+                          chunk_size=7) == 50
+    pd.testing.assert_frame_equal(load_arrow(store), records_to_frame(records))
@@ -0,0 +1,245 @@
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import store as store_module
+from rollups import build_rollups
+from sites import DROP_LOCK, FAILED_DIR, PROCESSED_DIR, segment_paths
+from solar_data import (DATE_COLUMN, MEASUREMENT_COLUMNS, derive_metrics,
+                        load_solar_data, records_to_frame, write_store)
+from store import SolarStore, _try_lock, load_partition
+from summary_stats import build_bucket_stats
+
+
+def telemetry(start, n, freq="h", seed=0):
+    rng = np.random.default_rng(seed)
+    columns = {DATE_COLUMN: pd.date_range(start, periods=n, freq=freq)}
+    columns.update({col: rng.gamma(2.0, 5.0, n) for col in MEASUREMENT_COLUMNS})
+    return records_to_frame(columns)
+
+
+def write_base(path, frame):
+    chunk = {DATE_COLUMN: frame.index.to_numpy()}
+    chunk.update({col: frame[col].to_numpy() for col in MEASUREMENT_COLUMNS})
+    write_store([chunk], path)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = str(tmp_path / "site.arrow")
+    write_base(path, telemetry("2024-01-01", 500))
+    return path
+
+
+def assert_matches_disk(store):
+    """The store's snapshot holds what a fresh load of its partition does,
+    with everything derived from it rebuilt from scratch"""
+    snapshot = store.snapshot
+    frame, version, _ = load_partition(store.source)
+    assert snapshot.version == version
+    pd.testing.assert_frame_equal(snapshot.frame, frame)
+    metrics = derive_metrics(frame)
+    pd.testing.assert_frame_equal(snapshot.metrics, metrics)
+    for name, rollup in build_rollups(metrics).items():
+        pd.testing.assert_frame_equal(snapshot.rollups[name], rollup,
+                                      check_freq=False)
+    for col, stats in build_bucket_stats(metrics).items():
+        np.testing.assert_array_equal(snapshot.bucket_stats[col].count,
+                                      stats.count)
+        np.testing.assert_allclose(snapshot.bucket_stats[col].mean, stats.mean)
+
+
+def test_appends_in_order_write_in_place(source):
+    store = SolarStore(source)
+    first = store.snapshot
+    for i in range(5):
+        store.append(telemetry(pd.Timestamp("2024-01-22") + pd.Timedelta(days=i),
+                               24, seed=i))
+    assert_matches_disk(store)
+    assert len(store.snapshot.frame) == 500 + 5 * 24
+    # Earlier snapshots never change, and frame and metrics share columns
+    assert len(first.frame) == 500
+    assert np.shares_memory(store.snapshot.frame['Energy_Generated_kWh'].to_numpy(),
+                            store.snapshot.metrics['energy_kwh'].to_numpy())
+
+
+def test_appends_do_not_copy_the_history(source):
+    store = SolarStore(source)
+    store.append(telemetry("2024-01-22", 24))
+    columns = store._columns
+    before = store.snapshot.frame['Energy_Generated_kWh'].to_numpy()
+    store.append(telemetry("2024-01-23", 24, seed=1))
+    assert store._columns is columns
+    after = store.snapshot.frame['Energy_Generated_kWh'].to_numpy()
+    assert np.shares_memory(before, after)
+
+
+def test_late_rows_are_sorted_in(source):
+    store = SolarStore(source)
+    store.append(telemetry("2024-01-22", 24))
+    store.append(telemetry("2024-01-05 00:30", 10, seed=2))
+    assert store.snapshot.frame.index.is_monotonic_increasing
+    assert_matches_disk(store)
+
+
+def test_stores_pick_up_each_others_segments(source):
+    a, b = SolarStore(source), SolarStore(source)
+    a.append(telemetry("2024-01-22", 24))
+    b.append(telemetry("2024-01-23", 24, seed=1))
+    a.append(telemetry("2024-01-24", 24, seed=2))
+    assert len(segment_paths(a.segment_dir)) == 3
+    a.refresh()
+    b.refresh()
+    assert a.version == b.version
+    pd.testing.assert_frame_equal(a.snapshot.metrics, b.snapshot.metrics)
+    assert_matches_disk(a)
+    assert_matches_disk(b)
+
+
+@pytest.fixture
+def drop_store(source, tmp_path):
+    drop_dir = tmp_path / "incoming"
+    drop_dir.mkdir()
+    return SolarStore(source, str(drop_dir))
+
+
+def drop(store, name, frame):
+    path = os.path.join(store.drop_dir, name)
+    frame[MEASUREMENT_COLUMNS].reset_index().to_csv(path, index=False)
+    return path
+
+
+def test_bad_drop_files_are_set_aside(drop_store, caplog):
+    drop(drop_store, "a.csv", telemetry("2024-01-22", 24))
+    with open(os.path.join(drop_store.drop_dir, "b.json"), "w") as f:
+        f.write('[{"Date": "2024-01-23"')
+    with caplog.at_level(logging.ERROR, logger="store"):
+        assert drop_store.ingest_drop_dir() == 24
+    assert os.listdir(os.path.join(drop_store.drop_dir, PROCESSED_DIR)) == ["a.csv"]
+    assert os.listdir(os.path.join(drop_store.drop_dir, FAILED_DIR)) == ["b.json"]
+    assert "b.json" in caplog.text
+    assert_matches_disk(drop_store)
+
+
+def test_crash_before_moving_a_drop_file_does_not_duplicate(drop_store, monkeypatch):
+    drop(drop_store, "a.csv", telemetry("2024-01-22", 24))
+
+    def crash(*args):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(drop_store, "_move_dropped", crash)
+    with pytest.raises(KeyboardInterrupt):
+        drop_store.ingest_drop_dir()
+    monkeypatch.undo()
+
+    # The segment was written, the file never moved; a new process retries
+    restarted = SolarStore(drop_store.source, drop_store.drop_dir)
+    assert restarted.ingest_drop_dir() == 0
+    assert not os.path.exists(os.path.join(drop_store.drop_dir, "a.csv"))
+    assert len(restarted.snapshot.frame) == 500 + 24
+    assert_matches_disk(restarted)
+
+
+def test_drop_dir_is_skipped_while_another_process_ingests(drop_store):
+    drop(drop_store, "a.csv", telemetry("2024-01-22", 24))
+    with _try_lock(os.path.join(drop_store.drop_dir, DROP_LOCK)) as locked:
+        assert locked
+        assert drop_store.ingest_drop_dir() == 0
+    assert drop_store.ingest_drop_dir() == 24
+
+
+def test_compaction_folds_segments_into_the_base(source):
+    a, b = SolarStore(source), SolarStore(source)
+    for i in range(6):
+        a.append(telemetry(pd.Timestamp("2024-01-22") + pd.Timedelta(days=i),
+                           24, seed=i))
+    b.refresh()
+    assert a.compact(min_segments=10) == 0
+    assert a.compact(min_segments=6) == 6
+    assert segment_paths(a.segment_dir) == []
+    assert len(load_solar_data(source)) == 500 + 6 * 24
+    assert_matches_disk(a)
+
+    # b already held every folded segment, so it carries on without reloading
+    columns = b._columns
+    b.append(telemetry("2024-01-28", 24, seed=9))
+    assert b._columns is columns
+    a.refresh()
+    assert a.version == b.version
+    assert_matches_disk(a)
+    assert_matches_disk(b)
+
+
+def test_store_that_missed_a_folded_segment_reloads(source):
+    a, c = SolarStore(source), SolarStore(source)
+    for i in range(3):
+        a.append(telemetry(pd.Timestamp("2024-01-22") + pd.Timedelta(days=i),
+                           24, seed=i))
+    a.compact(min_segments=3)
+    c.refresh()
+    assert len(c.snapshot.frame) == 500 + 3 * 24
+    assert_matches_disk(c)
+
+
+def test_segments_left_behind_by_a_compaction_are_not_loaded_twice(
+        source, monkeypatch):
+    a, b = SolarStore(source), SolarStore(source)
+    for i in range(3):
+        a.append(telemetry(pd.Timestamp("2024-01-22") + pd.Timedelta(days=i),
+                           24, seed=i))
+    b.refresh()
+
+    # The compacting process dies after replacing the base, before deleting
+    def crash(path):
+        raise KeyboardInterrupt
+    monkeypatch.setattr(store_module.os, "remove", crash)
+    with pytest.raises(KeyboardInterrupt):
+        a.compact(min_segments=3)
+    monkeypatch.undo()
+    assert len(segment_paths(a.segment_dir)) == 3
+
+    b.refresh()
+    restarted = SolarStore(source)
+    for store in (b, restarted):
+        assert len(store.snapshot.frame) == 500 + 3 * 24
+        assert_matches_disk(store)
+
+    # The next compaction clears them out
+    restarted.append(telemetry("2024-01-25", 24, seed=5))
+    assert restarted.compact(min_segments=4) == 4
+    assert segment_paths(restarted.segment_dir) == []
+    b.refresh()
+    assert_matches_disk(restarted)
+    assert_matches_disk(b)
+
+
+def test_base_replaced_some_other_way_is_reloaded(source):
+    store = SolarStore(source)
+    store.append(telemetry("2024-01-22", 24))
+    write_base(source, telemetry("2023-06-01", 100, seed=7))
+    os.utime(source, ns=(store.version[0] + 10**9,) * 2)
+    store.refresh()
+    assert len(store.snapshot.frame) == 100 + 24
+    assert_matches_disk(store)
+
+
+def test_poll_compacts(source, monkeypatch):
+    monkeypatch.setattr(store_module.SolarStore.compact, "__defaults__", (2,))
+    store = SolarStore(source)
+    store.append(telemetry("2024-01-22", 24))
+    store.append(telemetry("2024-01-23", 24, seed=1))
+    store.poll(interval=0)
+    assert segment_paths(store.segment_dir) == []
+    assert_matches_disk(store)
+
+
+def test_fx_table_change_rederives_cost_saved(source, monkeypatch):
+    store = SolarStore(source)
+    store.append(telemetry("2024-01-22", 24))
+    version, fx = store.snapshot.key
+    monkeypatch.setattr(store_module, "fx_version", lambda: fx + 1)
+    store.refresh()
+    assert store.snapshot.key == (version, fx + 1)
+    assert_matches_disk(store)
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from conftest import random_windows
+from solar_data import select_window
+from summary_stats import (SUMMARY_COLUMNS, SUMMARY_PERCENTILES,
+                           build_bucket_stats, update_bucket_stats,
+                           window_summary)
+
+# Largest error allowed in the rank (as a fraction of the window's values)
+# of a t-digest percentile estimate
+RANK_TOLERANCE = 0.01
+
+
+def test_window_summary_is_exact_except_percentiles(metrics):
+    stats = build_bucket_stats(metrics)
+    for start, end in random_windows(metrics, 60, seed=2):
+        summary = window_summary(stats, metrics, start, end)
+        window = select_window(metrics, start, end)
+        for col in SUMMARY_COLUMNS:
+            values = window[col].to_numpy(dtype=np.float64)
+            values = np.sort(values[~np.isnan(values)])
+            expected = pd.Series(values).describe()
+            got = summary[col]
+            assert got['count'] == len(values)
+            if not len(values):
+                continue
+            for stat in ('mean', 'std', 'min', 'max'):
+                np.testing.assert_allclose(got[stat], expected[stat],
+                                           rtol=1e-9, equal_nan=True)
+            for p in SUMMARY_PERCENTILES:
+                estimate = got[f"{p * 100:g}%"]
+                below = np.searchsorted(values, estimate, side="left")
+                at_or_below = np.searchsorted(values, estimate, side="right")
+                slack = RANK_TOLERANCE * len(values) + 1
+                assert below - slack <= p * len(values) <= at_or_below + slack
+
+
+def test_update_bucket_stats_matches_rebuild(metrics):
+    cut = len(metrics) // 2
+    stats = build_bucket_stats(metrics.iloc[:cut])
+    stats = update_bucket_stats(stats, metrics, metrics.index[cut])
+    expected = build_bucket_stats(metrics)
+    for col in SUMMARY_COLUMNS:
+        for name in ("buckets", "count", "mean", "m2", "min", "max",
+                     "centroids", "weights", "offsets"):
+            np.testing.assert_array_equal(getattr(stats[col], name),
+                                          getattr(expected[col], name))
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tariffs import TARIFFS, Tariff
+
+
+def energy(dates, kwh):
+    return pd.Series(kwh, index=pd.DatetimeIndex(pd.to_datetime(dates), name="Date"),
+                     name="energy_kwh", dtype=np.float64)
+
+
+def band_charges(index, kwh, tiers):
+    """Reference tier charges: walk the rows one at a time, spending each
+    row's energy band by band and resetting at every new month"""
+    charges, used, month = [], 0.0, None
+    for ts, left in zip(index, kwh):
+        if (ts.year, ts.month) != month:
+            used, month = 0.0, (ts.year, ts.month)
+        cost = 0.0
+        for upper, rate in tiers:
+            top = np.inf if upper is None else upper
+            take = min(max(top - used, 0.0), left)
+            cost += take * rate
+            used += take
+            left -= take
+        charges.append(cost)
+    return np.array(charges)
+
+
+def test_tier_charges_match_row_by_row_reference():
+    rng = np.random.default_rng(3)
+    index = pd.date_range("2024-01-01", "2024-06-30", freq="3h")
+    series = energy(index, rng.gamma(2.0, 4.0, len(index)))
+    tiered = TARIFFS["Tiered"]
+    np.testing.assert_allclose(tiered.value(series).to_numpy(),
+                               band_charges(index, series.to_numpy(), tiered.tiers))
+
+
+def test_tiers_reset_each_month():
+    series = energy(["2024-01-05", "2024-01-20", "2024-02-01"], [600, 400, 100])
+    value = TARIFFS["Tiered"].value(series)
+    # 300 * 0.10 + 500 * 0.16 + 200 * 0.24
+    assert value.iloc[:2].sum() == pytest.approx(158)
+    assert value.iloc[2] == pytest.approx(10)
+
+
+def test_row_straddling_a_band_is_split():
+    value = TARIFFS["Tiered"].value(energy(["2024-03-01", "2024-03-02"], [250, 100]))
+    # 50 kWh left in the first band, 50 in the second
+    assert value.tolist() == pytest.approx([25, 13])
+
+
+@pytest.mark.parametrize("ts, rate", [
+    ("2024-01-08 03:00", 0.08),     # winter night
+    ("2024-01-08 17:00", 0.22),     # winter weekday peak
+    ("2024-01-13 17:00", 0.12),     # winter weekend
+    ("2024-07-10 15:00", 0.30),     # summer weekday peak
+    ("2024-07-10 20:00", 0.12),     # after the summer peak
+    ("2024-07-14 06:00", 0.08),     # summer weekend night
+])
+def test_time_of_use_rates(ts, rate):
+    tou = TARIFFS["Time of use"]
+    assert tou.rates(pd.DatetimeIndex([ts]))[0] == pytest.approx(rate)
+    assert tou.value(energy([ts], [2.0])).iloc[0] == pytest.approx(2 * rate)
+
+
+def test_flat_tariff():
+    series = energy(["2024-01-01 00:00", "2024-07-01 12:00"], [1.5, 4.0])
+    assert Tariff.flat(0.15).value(series).tolist() == pytest.approx([0.225, 0.6])
+
+
+def test_tariffs_compare_by_definition():
+    tiers = [(300, 0.10), (None, 0.20)]
+    a = Tariff("a", 0, tiers=tiers)
+    b = Tariff("b", 0.0, tiers=[(300.0, 0.1), (None, 0.2)])
+    assert a == b and hash(a) == hash(b)
+    assert a != Tariff("a", 0, tiers=[(300, 0.10), (None, 0.25)])
+    assert Tariff.flat(0.15) == Tariff.flat(0.15)
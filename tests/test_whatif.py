@@ -0,0 +1,55 @@
+import numpy as np
+
+from whatif import WhatIfGraph
+
+
+def make_graph(max_bytes):
+    graph = WhatIfGraph(max_bytes=max_bytes)
+    calls = []
+
+    @graph.node(params=('n',))
+    def values(data, n):
+        calls.append(('values', n))
+        return np.full(n, data, dtype=np.float64)
+
+    @graph.node('values', params=('scale',))
+    def scaled(data, values, scale):
+        calls.append(('scaled', scale))
+        return values * scale
+
+    return graph, calls
+
+
+def test_nodes_recompute_only_for_their_own_parameters():
+    graph, calls = make_graph(10 ** 6)
+    assert graph.params_of('scaled') == ['n', 'scale']
+    graph.get('scaled', 'key', 1.0, n=10, scale=2)
+    graph.get('scaled', 'key', 1.0, n=10, scale=3)
+    assert calls == [('values', 10), ('scaled', 2), ('scaled', 3)]
+    assert graph.nbytes == 3 * 80
+
+
+def test_least_recently_used_values_are_evicted_past_the_byte_limit():
+    graph, calls = make_graph(max_bytes=3 * 800)
+    first = graph.get('values', 'a', 1.0, n=100)
+    graph.get('values', 'b', 1.0, n=100)
+    graph.get('values', 'a', 1.0, n=100)      # a is now the most recent
+    graph.get('values', 'c', 1.0, n=100)
+    assert graph.nbytes == 3 * 800
+    graph.get('values', 'd', 1.0, n=100)      # evicts b
+    assert graph.nbytes <= graph.max_bytes
+    calls.clear()
+    assert graph.get('values', 'a', 1.0, n=100) is first
+    graph.get('values', 'b', 1.0, n=100)
+    assert calls == [('values', 100)]
+
+
+def test_a_value_over_the_limit_is_still_kept():
+    graph, calls = make_graph(max_bytes=100)
+    big = graph.get('values', 'a', 1.0, n=1000)
+    assert graph.nbytes == 8000
+    assert graph.get('values', 'a', 1.0, n=1000) is big
+    graph.get('values', 'b', 1.0, n=1000)
+    assert graph.nbytes == 8000
+    graph.clear()
+    assert graph.nbytes == 0
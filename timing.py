@@ -0,0 +1,132 @@
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Latest durations kept per stage for the percentiles
+SPAN_BUFFER_SIZE = 1024
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+METRIC_NAME = "solar_dashboard_stage_seconds"
+
+
+class Recorder:
+    """Stage latencies, kept in a fixed-size ring buffer per stage.
+
+    Recording is an append under a lock, cheap enough for every rerun.
+    Percentiles cover the last SPAN_BUFFER_SIZE samples of a stage; the
+    running count and sum cover every sample since start-up.
+    """
+
+    def __init__(self, size=SPAN_BUFFER_SIZE):
+        self.size = size
+        self._samples = {}
+        self._totals = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage, seconds):
+        with self._lock:
+            buf = self._samples.get(stage)
+            if buf is None:
+                buf = self._samples[stage] = deque(maxlen=self.size)
+            buf.append(seconds)
+            count, total = self._totals.get(stage, (0, 0.0))
+            self._totals[stage] = (count + 1, total + seconds)
+
+    @contextmanager
+    def span(self, stage):
+        """Record how long the with-block takes as stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def laps(self):
+        """A Laps timer recording into this recorder"""
+        return Laps(self)
+
+    def stats(self, percentiles=PERCENTILES):
+        """{stage: {'count', 'sum', percentile: seconds, ...}}, stages in
+        first-recorded order"""
+        with self._lock:
+            snapshot = {stage: (sorted(buf), self._totals[stage])
+                        for stage, buf in self._samples.items()}
+        stats = {}
+        for stage, (samples, (count, total)) in snapshot.items():
+            stats[stage] = {'count': count, 'sum': total}
+            for p in percentiles:
+                stats[stage][p] = _nearest_rank(samples, p)
+        return stats
+
+    def prometheus_text(self, metric=METRIC_NAME):
+        """Prometheus text exposition of the stats, as a summary per stage"""
+        lines = [f"# HELP {metric} Duration of dashboard rerun stages",
+                 f"# TYPE {metric} summary"]
+        for stage, stats in self.stats().items():
+            label = stage.replace("\\", "\\\\").replace('"', '\\"')
+            for p in PERCENTILES:
+                lines.append(f'{metric}{{stage="{label}",quantile="{p:g}"}} '
+                             f"{stats[p]:.6g}")
+            lines.append(f'{metric}_sum{{stage="{label}"}} {stats["sum"]:.6g}')
+            lines.append(f'{metric}_count{{stage="{label}"}} {stats["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+
+class Laps:
+    """Consecutive spans: each lap(stage) records the time since the
+    previous lap (or since the timer was made)"""
+
+    __slots__ = ("recorder", "_last")
+
+    def __init__(self, recorder):
+        self.recorder = recorder
+        self._last = time.perf_counter()
+
+    def lap(self, stage):
+        now = time.perf_counter()
+        self.recorder.record(stage, now - self._last)
+        self._last = now
+
+
+def _nearest_rank(samples, p):
+    if not samples:
+        return math.nan
+    return samples[max(math.ceil(p * len(samples)) - 1, 0)]
+
+
+recorder = Recorder()
+
+
+def serve_metrics(port, host="127.0.0.1", source=recorder):
+    """Serve source's Prometheus text at http://host:port/metrics from a
+    daemon thread; returns the server"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = source.prometheus_text().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True,
+                     name="metrics").start()
+    return server
@@ -0,0 +1,113 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from currency import BASE_CURRENCY, convert
+from pv_model import expected_energy
+
+# Memory the computed series kept across reruns may take, in bytes of
+# values (least recently used evicted). Each series spans the whole
+# history - about 42 MB for ten years of minute data - so the bound is on
+# size, not on a count of entries.
+WHATIF_CACHE_MAX_BYTES = 512 * 2 ** 20
+
+
+class WhatIfGraph:
+    """Parameter-dependent computations with per-node memoisation.
+
+    Each node names the nodes it reads and the parameters it uses itself.
+    A node's result is cached on the data key plus only the parameters it
+    depends on (directly or through its inputs), so changing one parameter
+    recomputes just the nodes downstream of it; everything else is a lookup.
+    """
+
+    def __init__(self, max_bytes=WHATIF_CACHE_MAX_BYTES):
+        self._nodes = {}
+        self._cache = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.max_bytes = max_bytes
+
+    def node(self, *inputs, params=()):
+        """Register fn(data, *input_values, **params) as a node"""
+        def register(fn):
+            self._nodes[fn.__name__] = (fn, inputs, tuple(params))
+            return fn
+        return register
+
+    def params_of(self, name):
+        """Every parameter a node depends on, sorted"""
+        _, inputs, own = self._nodes[name]
+        deps = set(own)
+        for dep in inputs:
+            deps.update(self.params_of(dep))
+        return sorted(deps)
+
+    def get(self, name, data_key, data, **params):
+        """Value of a node for data (identified by data_key) and params"""
+        fn, inputs, own = self._nodes[name]
+        key = (name, data_key) + tuple(
+            (p, params[p]) for p in self.params_of(name))
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        args = [self.get(dep, data_key, data, **params) for dep in inputs]
+        value = fn(data, *args, **{p: params[p] for p in own})
+        with self._lock:
+            if key in self._cache:
+                self._bytes -= _nbytes(self._cache[key])
+            self._cache[key] = value
+            self._bytes += _nbytes(value)
+            # The newest value stays even if it alone is over the limit
+            while self._bytes > self.max_bytes and len(self._cache) > 1:
+                _, evicted = self._cache.popitem(last=False)
+                self._bytes -= _nbytes(evicted)
+        return value
+
+    @property
+    def nbytes(self):
+        """Bytes of values currently cached"""
+        return self._bytes
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+
+
+def _nbytes(value):
+    # Values only: the series share their snapshot's index
+    return getattr(value, "nbytes", 0)
+
+
+graph = WhatIfGraph()
+
+
+@graph.node()
+def energy(snapshot):
+    return snapshot.metrics['energy_kwh'].astype(np.float64)
+
+
+@graph.node(params=('capacity_kw', 'panel_efficiency'))
+def expected(snapshot, capacity_kw, panel_efficiency):
+    return expected_energy(snapshot.frame, capacity_kw, panel_efficiency)
+
+
+@graph.node('energy', params=('tariff',))
+def savings_at_tariff(snapshot, energy, tariff):
+    """Savings if every kWh generated were valued under tariff"""
+    return tariff.value(energy)
+
+
+@graph.node('expected', params=('tariff',))
+def expected_savings(snapshot, expected, tariff):
+    """Savings the PV model expects under tariff"""
+    return tariff.value(expected)
+
+
+@graph.node(params=('currency',))
+def cost_in_currency(snapshot, currency):
+    """Recorded savings converted from BASE_CURRENCY at each row's FX rate"""
+    return convert(snapshot.metrics['cost_saved'], BASE_CURRENCY, currency)